@@ -0,0 +1,70 @@
+"""
+Benchmark parsing of very large node logs, like those produced by long MIP runs.
+
+A synthetic log is generated from one of the example logs by repeating its
+node log table rows until the requested number of lines is reached. The log is
+then parsed with the tokenizer fast path for table rows, and with the fast path
+disabled so that every row goes through the NodeLogParser regexes:
+
+    python scripts/benchmark-nodelog.py --lines 5000000
+
+"""
+
+import argparse
+import tempfile
+import time
+
+from grblogtools.api import parse_logfile
+from grblogtools.parsers.nodelog import NodeLogParser
+
+
+def write_log(outfile, template, lines):
+    """Write a log with the header and footer of the template log and its node
+    log table rows repeated to give (roughly) the given number of lines."""
+    with open(template) as infile:
+        loglines = infile.readlines()
+    start = next(
+        i
+        for i, line in enumerate(loglines)
+        if NodeLogParser.tree_search_start.match(line)
+    )
+    end = next(i for i, line in enumerate(loglines) if line.startswith("Explored"))
+    rows = [line for line in loglines[start + 1 : end] if line.strip()]
+    outfile.writelines(loglines[: start + 1])
+    for _ in range(max(lines // len(rows), 1)):
+        outfile.writelines(rows)
+    outfile.writelines(loglines[end:])
+    outfile.flush()
+
+
+def run(logfile, label):
+    start = time.perf_counter()
+    ((_, _, parser),) = parse_logfile(logfile)
+    elapsed = time.perf_counter() - start
+    rows = len(parser.nodelog_parser.get_progress())
+    print(f"{label:>10}: {elapsed:8.2f}s  ({rows / elapsed:,.0f} rows/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--lines", type=int, default=2_000_000, help="approximate log length"
+    )
+    parser.add_argument(
+        "--template", default="data/912-glass4-0.log", help="log to take rows from"
+    )
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".log") as outfile:
+        write_log(outfile, args.template, args.lines)
+        run(outfile.name, "fast path")
+        parse_row = NodeLogParser.parse_row
+        NodeLogParser.parse_row = lambda self, line: None
+        try:
+            run(outfile.name, "regex")
+        finally:
+            NodeLogParser.parse_row = parse_row
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,13 @@
 __version__ = "2.0.0"
 
-from grblogtools.api import get_dataframe, parse
-from grblogtools.plotting import plot
+from grblogtools.api import follow, get_dataframe, parse, parse_async, scan
+
+
+def __getattr__(name):
+    # plotting imports plotly and ipywidgets, which take long to load and are
+    # not needed for parsing, so it is only imported once plot is used
+    if name == "plot":
+        from grblogtools.plotting import plot
+
+        return plot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
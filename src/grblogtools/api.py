@@ -11,157 +11,716 @@ OR, use
     summary, timeline = glt.get_dataframe("data/*.log", timeline=True)
 """
 
+import asyncio
 import glob
-import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List, Union
 
+import numpy as np
 import pandas as pd
 
+from grblogtools.cache import DEFAULT_CACHE_SIZE, ParseCache
+from grblogtools.export import write_result
+from grblogtools.fast_summary import parse_head_tail
+from grblogtools.follow import LogFollower
 from grblogtools.helpers import (
     add_categorical_descriptions,
     fill_default_parameters_nosuffix,
     strip_model_and_seed,
 )
-from grblogtools.parsers.single_log import SingleLogParser
+from grblogtools.parsers.multi_log import MultiLogParser
+from grblogtools.parsers.single_log import PROGRESS_SECTIONS
+from grblogtools.readers import (
+    compression_suffixes,
+    read_line_batches_async,
+    reader_errors,
+    readers,
+)
+from grblogtools.schema import (
+    append_rows,
+    compact_frame,
+    concat_columns,
+    summary_columns,
+)
+from grblogtools.segments import (
+    INDEX_SUFFIX,
+    find_segments,
+    parse_segment,
+    scan_logfile,
+    stitch_segments,
+)
 
 
 class ParseResult:
     def __init__(self):
         self.parsers = []
-        self._common = None
+        self._followers = []
+        # Frames with the rows of each run parsed so far, extended when runs
+        # are appended to self.parsers
+        self._run_frames = {}
+        # Frames returned by the methods below, with the number of runs they
+        # were built from
+        self._derived = {}
 
-    def progress(self, section="nodelog") -> dict:
+    def progress(self, section="nodelog", normalized=False, compact=False) -> dict:
         """Return the search progress for the given section in the log.
 
+        Each row holds the LogId of its run, which is the index of the run in
+        the runs() table. The data of the run is joined to the rows by this
+        index, with text columns such as Log and LogFilePath as categoricals.
+
+        Only the normalized rows are cached, and extended when runs are added to
+        this result. Joined and compact frames are built from them on each call,
+        so that a single copy of the rows is kept besides the returned frame.
+
         Args:
             section (str): Possible values are norel, rootlp, and nodelog. Defaults
                 to nodelog.
+            normalized (bool, optional): Only return the LogId instead of
+                joining the data of the run to every row. Defaults to False.
+            compact (bool, optional): Store the columns in the narrowest
+                dtypes holding their values, see schema.compact_frame for the
+                precision kept. Defaults to False.
 
         Returns:
             pd.DataFrame: A data frame representing the progress of the given section
                 in the log.
         """
-        progress = []
-        for logfile, lognumber, parser in self.parsers:
-            if section == "nodelog":
-                log = parser.nodelog_parser.get_progress()
-            elif section == "rootlp":
-                log = parser.continuous_parser.get_progress()
-            elif section == "norel":
-                log = parser.norel_parser.get_progress()
+        if section not in PROGRESS_SECTIONS:
+            raise ValueError(f"Unknown section '{section}'")
+
+        progress = self._run_frame(
+            ("progress", section), partial(progress_frame, section)
+        )
+        if normalized:
+            return compact_frame(progress) if compact else progress.copy()
+
+        logid = progress["LogId"].to_numpy()
+        columns = {name: data for name, data in progress.items() if name != "LogId"}
+        for name, data in self._common_log_data().items():
+            if data.dtype == object:
+                columns[name] = pd.Categorical(data).take(logid)
             else:
-                raise ValueError(f"Unknown section '{section}'")
+                columns[name] = data.to_numpy()[logid]
+        progress = pd.DataFrame(columns, index=progress.index)
+        return compact_frame(progress) if compact else progress
 
-            progress.append(
-                pd.DataFrame(log).assign(LogFilePath=logfile, LogNumber=lognumber)
-            )
+    def to_csv(self, path: str, partition_by=None, sections=None) -> None:
+        """Write the summary and the progress sections to CSV files in the
+        directory path, see export.write_result.
+
+        Progress rows are written for batches of runs, without building the
+        progress frame of all runs.
+
+        Args:
+            path (str): Output directory, created if needed.
+            partition_by (list, optional): Columns to partition the outputs by,
+                e.g. ["Version", "Model"]. Defaults to None, writing a single
+                file per output.
+            sections (list, optional): Progress sections to write. Defaults to
+                the sections whose progress was collected for all runs.
+        """
+        write_result(self, path, "csv", partition_by=partition_by, sections=sections)
+
+    def to_jsonl(self, path: str, partition_by=None, sections=None) -> None:
+        """Write the summary and the progress sections to JSON Lines files in
+        the directory path, see to_csv."""
+        write_result(self, path, "jsonl", partition_by=partition_by, sections=sections)
+
+    def to_parquet(self, path: str, partition_by=None, sections=None) -> None:
+        """Write the summary and the progress sections to Parquet files in the
+        directory path, see to_csv. Requires pyarrow."""
+        write_result(
+            self, path, "parquet", partition_by=partition_by, sections=sections
+        )
 
-        return pd.merge(
-            left=pd.concat(progress),
-            right=self.common_log_data(),
-            how="left",
-            on=["LogFilePath", "LogNumber"],
+    def to_feather(self, path: str, partition_by=None, sections=None) -> None:
+        """Write the summary and the progress sections to Feather files in the
+        directory path, see to_csv. Requires pyarrow."""
+        write_result(
+            self, path, "feather", partition_by=partition_by, sections=sections
         )
 
+    def runs(self):
+        """Return the data of each run, indexed by the LogId referenced by the
+        rows of normalized progress frames.
+
+        The result is cached until runs are added to this result.
+        """
+        return self._common_log_data().rename_axis("LogId")
+
     def common_log_data(self):
         """Extract common data to be joined to progress and summary dataframes.
 
-        This could be cached in future and invalidated by .parse().
+        The result is cached until runs are added to this result.
         """
-        common = pd.DataFrame(
-            [
-                {
-                    "LogFilePath": logfile,
-                    "LogNumber": lognumber,
-                    "ModelFilePath": parser.header_parser.get_summary().get(
-                        "ModelFilePath"
-                    ),
-                    "Seed": parser.header_parser.get_parameters().get("Seed", 0),
-                    "Version": parser.header_parser.get_summary().get("Version"),
-                }
-                for logfile, lognumber, parser in self.parsers
-            ]
-        )
-        common = common.dropna(axis="columns", how="all")
-        if "ModelFilePath" in common:
-            common = common.assign(
-                ModelFile=lambda df: df["ModelFilePath"].apply(
-                    lambda p: None if p is None else Path(p).parts[-1].partition(".")[0]
-                ),
-                Model=lambda df: df["ModelFile"],
-                Log=lambda df: df.apply(strip_model_and_seed, axis=1),
-            )
-        return common
+        return self._common_log_data().copy()
+
+    def _common_log_data(self):
+        def build():
+            common = self._run_frame("common", common_frame)
+            return common.dropna(axis="columns", how="all")
+
+        return self._derive("common", build)
 
     def summary(self, prettyparams=False):
-        """Construct and return a summary dataframe for all parsed logs."""
-        summary = pd.DataFrame(
-            [
-                dict(parser.get_summary(), LogFilePath=logfile, LogNumber=lognumber)
-                for logfile, lognumber, parser in self.parsers
-            ]
-        )
-        parameters = pd.DataFrame(
-            [parser.header_parser.get_parameters() for _, _, parser in self.parsers]
-        )
-        # Fill defaults and add suffix to parameter columns.
-        parameters = (
-            fill_default_parameters_nosuffix(parameters.join(summary["Version"]))
-            .drop(columns=["Version", "Seed"], errors="ignore")
-            .rename(columns=lambda c: c + " (Parameter)")
-        )
-        # Convert parameters to categorical if required.
-        if prettyparams:
-            parameters = add_categorical_descriptions(parameters)
-        summary = summary.join(parameters)
-        summary = pd.merge(
-            left=summary.drop(columns=["ModelFilePath", "Version"], errors="ignore"),
-            right=self.common_log_data(),
-            how="left",
-            on=["LogFilePath", "LogNumber"],
+        """Construct and return a summary dataframe for all parsed logs.
+
+        The result is cached until runs are added to this result.
+        """
+
+        def build():
+            summary = self._run_columns("summary", summary_rows)
+            index = pd.RangeIndex(len(self.parsers))
+            parameters = self._run_frame("parameters", parameters_frame)
+            # Fill defaults and add suffix to parameter columns.
+            parameters = (
+                fill_default_parameters_nosuffix(
+                    parameters.assign(Version=pd.Series(summary.get("Version"), index))
+                )
+                .drop(columns=["Version", "Seed"], errors="ignore")
+                .rename(columns=lambda c: c + " (Parameter)")
+            )
+            # Convert parameters to categorical if required.
+            if prettyparams:
+                parameters = add_categorical_descriptions(parameters)
+            # Runs are in the same order in all three parts, so the columns are
+            # put side by side and the frame is built once.
+            columns = {
+                name: data
+                for name, data in summary.items()
+                if name not in ("ModelFilePath", "Version")
+            }
+            columns.update(parameters.items())
+            common = self._common_log_data()
+            columns.update(
+                (name, common[name].to_numpy())
+                for name in common.columns
+                if name not in ("LogFilePath", "LogNumber")
+            )
+            return pd.DataFrame(columns, index=index)
+
+        return self._derive(("summary", prettyparams), build).copy()
+
+    def _run_frame(self, name, build) -> pd.DataFrame:
+        """Return the frame built by build(runs, start) for all runs, only
+        building the rows of runs added since the last call. start is the
+        position of the first of the runs in self.parsers."""
+        count, frame = self._run_frames.get(name, (0, None))
+        if frame is None or count < len(self.parsers):
+            added = build(self.parsers[count:], start=count)
+            if frame is not None:
+                added = pd.concat([frame, added], ignore_index=True)
+            frame = added
+            self._run_frames[name] = (len(self.parsers), frame)
+        return frame
+
+    def _run_columns(self, name, rows) -> dict:
+        """Return the typed columns of the rows yielded by rows(runs) for all
+        runs, only converting the rows of runs added since the last call."""
+        count, columns = self._run_frames.get(name, (0, None))
+        if columns is None or count < len(self.parsers):
+            added = {}
+            length = append_rows(added, 0, rows(self.parsers[count:]))
+            columns = concat_columns(
+                columns or {}, count, summary_columns(added), length
+            )
+            self._run_frames[name] = (count + length, columns)
+        return columns
+
+    def _subset(self, runs: list) -> "ParseResult":
+        """Return a result holding only the given runs."""
+        result = ParseResult()
+        result.parsers = runs
+        return result
+
+    def _derive(self, key, build) -> pd.DataFrame:
+        """Return the cached frame for the key, calling build() to rebuild it
+        if runs were added since it was built."""
+        count, frame = self._derived.get(key, (None, None))
+        if count != len(self.parsers):
+            frame = build()
+            self._derived[key] = (len(self.parsers), frame)
+        return frame
+
+    def _invalidate(self) -> None:
+        """Drop all cached frames, for when runs were changed in place."""
+        self._run_frames.clear()
+        self._derived.clear()
+
+    def parse(
+        self, logfile: str, jobs: int = 1, progress=True, reader: str = "text"
+    ) -> None:
+        """Parse a single file. The log file may contain multiple run logs, and
+        may be compressed with gzip, bzip2 or xz.
+
+        Args:
+            logfile (str): Path of the log file.
+            jobs (int, optional): Number of worker processes parsing segments
+                of a large file containing several run logs in parallel.
+                Defaults to 1, parsing the file serially in this process.
+            progress (bool or set, optional): Sections whose progress is
+                collected, see parse(). Defaults to True, collecting all.
+            reader (str, optional): How the log file is read, see parse().
+                Defaults to text.
+        """
+        if reader not in readers:
+            raise ValueError(f"Unknown reader '{reader}'")
+        sections = progress_sections(progress)
+        parsed = parse_logfiles(
+            [logfile], jobs=jobs, reader=reader, progress_sections=sections
         )
-        return summary
+        self.parsers.extend(parsed[logfile])
+
+    def follow(self, logfile: str, progress_limit: int = None) -> None:
+        """Parse a log file which is still being written and keep following it.
+
+        Lines appended to the file later are parsed by calling refresh().
+
+        Args:
+            logfile (str): Path of the log file to follow.
+            progress_limit (int, optional): Only keep this many of the most
+                recent rows of each progress table. Defaults to None, keeping
+                all rows.
+        """
+        self._followers.append(LogFollower(logfile, progress_limit=progress_limit))
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Parse the lines appended to all followed log files since the last
+        call. Runs which started in the meantime are added to the result.
+
+        The runs of a followed file which was truncated or replaced are removed
+        and the file is parsed again. Cached frames are only rebuilt if any
+        followed file changed.
+        """
+        changed = False
+        for follower in self._followers:
+            parsers, offset = follower.parser.parsers, follower.offset
+            runs = follower.refresh()
+            if follower.parser.parsers is not parsers:
+                # The file was truncated or replaced, drop the runs read before
+                stale = {id(parser) for parser in parsers}
+                self.parsers = [run for run in self.parsers if id(run[2]) not in stale]
+                changed = True
+            self.parsers.extend(runs)
+            # Runs of followed files are updated in place
+            changed = changed or follower.offset != offset
+        if changed:
+            self._invalidate()
+
+
+def progress_frame(section: str, runs: list, start: int = 0) -> pd.DataFrame:
+    """Return the progress rows of the given section of the runs, with the
+    LogId of their run."""
+    progress = []
+    for logid, (logfile, lognumber, parser) in enumerate(runs, start):
+        if section not in parser.progress_sections:
+            raise ValueError(
+                f"Progress of section '{section}' was not collected for "
+                f"{logfile}, parse it with progress=True"
+            )
+        log = parser.get_progress_table(section)
+        columns = log.to_columns()
+        columns["LogId"] = np.full(len(log), logid, dtype=np.int32)
+        progress.append(pd.DataFrame(columns, index=pd.RangeIndex(len(log))))
+    return pd.concat(progress, ignore_index=True)
+
+
+def common_frame(runs: list, start: int = 0) -> pd.DataFrame:
+    """Return the data of the runs joined to the progress and summary frames.
+    Columns without any values are kept."""
+    rows = []
+    for logfile, lognumber, parser in runs:
+        header = parser.header_parser.get_summary()
+        model_file_path = header.get("ModelFilePath")
+        model = None
+        if model_file_path is not None:
+            model = Path(model_file_path).parts[-1].partition(".")[0]
+        row = {
+            "LogFilePath": logfile,
+            "LogNumber": lognumber,
+            "ModelFilePath": model_file_path,
+            "Seed": parser.header_parser.get_parameters().get("Seed", 0),
+            "Version": header.get("Version"),
+            "ModelFile": model,
+            "Model": model,
+        }
+        row["Log"] = strip_model_and_seed(row)
+        rows.append(row)
+    return pd.DataFrame(rows, index=pd.RangeIndex(start, start + len(rows)))
+
+
+def summary_rows(runs: list):
+    """Yield the summary data of the runs."""
+    for logfile, lognumber, parser in runs:
+        yield dict(parser.get_summary(), LogFilePath=logfile, LogNumber=lognumber)
+
+
+def parameters_frame(runs: list, start: int = 0) -> pd.DataFrame:
+    """Return the changed parameters of the runs."""
+    return pd.DataFrame(
+        [parser.header_parser.get_parameters() for _, _, parser in runs],
+        index=pd.RangeIndex(start, start + len(runs)),
+    )
 
-    def parse(self, logfile: str) -> None:
-        """Parse a single file. The log file may contain multiple run logs."""
-        parser = SingleLogParser()
-        subsequent = SingleLogParser()
-        lognumber = 1
-        with open(logfile) as infile:
-            lines = iter(infile)
-            for line in lines:
-                if not parser.parse(line):
-                    assert not subsequent.started
-                    if subsequent.parse(line):
-                        # The current parser did not match but an empty parser
-                        # matched a header line.
-                        self.parsers.append((logfile, lognumber, parser))
-                        lognumber += 1
-                        parser = subsequent
-                        subsequent = SingleLogParser()
 
-        self.parsers.append((logfile, lognumber, parser))
+def glob_logfiles(patterns: List[str]):
+    """Yield the files matching the glob patterns. Patterns with wildcards also
+    match compressed files named after a match plus a compression suffix,
+    unless the uncompressed file is matched too. Sidecar index files are
+    skipped."""
+    for pattern in patterns:
+        matches = glob.glob(pattern)
+        if glob.has_magic(pattern) and not pattern.endswith(compression_suffixes):
+            uncompressed = set(matches)
+            for suffix in compression_suffixes:
+                matches.extend(
+                    logfile
+                    for logfile in glob.glob(pattern + suffix)
+                    if logfile[: -len(suffix)] not in uncompressed
+                )
+        for logfile in matches:
+            if not logfile.endswith(INDEX_SUFFIX):
+                yield logfile
 
 
-def parse(patterns: Union[str, List[str]]) -> ParseResult:
+def parse_logfile(
+    logfile: str, reader: str = "text", progress_sections=PROGRESS_SECTIONS
+) -> list:
+    """Parse a single file and return a (logfile, lognumber, parser) tuple for
+    each run log it contains.
+
+    This is a module level function so that it can be sent to worker processes.
+    """
+    parser = MultiLogParser(progress_sections=progress_sections)
+    for line in readers[reader](logfile):
+        parser.parse(line)
+    return number_runs(logfile, parser.parsers)
+
+
+def number_runs(logfile: str, parsers: list) -> list:
+    """Return a (logfile, lognumber, parser) tuple for each run log parser."""
+    return [
+        (logfile, lognumber, parser)
+        for lognumber, parser in enumerate(parsers, start=1)
+    ]
+
+
+def parse_logfiles(
+    logfiles: List[str],
+    jobs: int = 1,
+    reader: str = "text",
+    progress_sections=PROGRESS_SECTIONS,
+    fast_summary: bool = False,
+) -> dict:
+    """Parse the given files, using a process pool if jobs is not 1.
+
+    With a process pool and fewer files than workers, large files containing
+    several run logs are split into segments at run log boundaries, which are
+    parsed in parallel too. Otherwise the files go to the pool as a whole, as
+    finding the boundaries takes a serial pre-scan of each file. With
+    fast_summary, only the head and the tail of large MIP logs are parsed where
+    possible.
+
+    Returns:
+        dict: The (logfile, lognumber, parser) tuples of each log file.
+    """
+    results = {}
+    if fast_summary:
+        for logfile in logfiles:
+            parsers = parse_head_tail(logfile, reader)
+            if parsers is not None:
+                results[logfile] = number_runs(logfile, parsers)
+        logfiles = [logfile for logfile in logfiles if logfile not in results]
+
+    if jobs == 1:
+        for logfile in logfiles:
+            results[logfile] = parse_logfile(logfile, reader, progress_sections)
+        return results
+
+    if len(logfiles) < (jobs or os.cpu_count() or 1):
+        segments = {logfile: find_segments(logfile) for logfile in logfiles}
+    else:
+        segments = {logfile: [(0, None)] for logfile in logfiles}
+    tasks = [
+        (logfile, start, end)
+        for logfile, ranges in segments.items()
+        for start, end in ranges
+    ]
+    if len(tasks) <= 1:
+        for logfile in logfiles:
+            results[logfile] = parse_logfile(logfile, reader, progress_sections)
+        return results
+
+    def task_size(task):
+        logfile, start, end = task
+        return (os.path.getsize(logfile) if end is None else end) - start
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Submit the largest tasks first so that workers finish at about the
+        # same time.
+        futures = {
+            task: executor.submit(parse_segment, *task, reader, progress_sections)
+            for task in sorted(tasks, key=task_size, reverse=True)
+        }
+        for logfile, ranges in segments.items():
+            parsers = stitch_segments(
+                [futures[(logfile, start, end)].result() for start, end in ranges]
+            )
+            if parsers is None:
+                # The pre-scan split a run log, fall back to a sequential parse
+                results[logfile] = parse_logfile(logfile, reader, progress_sections)
+                continue
+            results[logfile] = number_runs(logfile, parsers)
+        return results
+
+
+def parse(
+    patterns: Union[str, List[str]],
+    jobs: int = 1,
+    cache_dir: str = None,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    reader: str = "text",
+    progress=True,
+    fast_summary: bool = False,
+) -> ParseResult:
     """Main entry point function.
 
     Args:
         patterns (str): a single glob pattern, or list of patterns, matching
-        log files.
+            log files. Files compressed with gzip, bzip2 or xz are detected from
+            their contents and decompressed on the fly. Patterns with wildcards
+            also match compressed files named after a match plus a .gz, .bz2
+            or .xz suffix, unless the uncompressed file is matched too.
+        jobs (int, optional): Number of worker processes used to parse the log
+            files. When there are fewer files than processes, large files
+            containing several run logs are split at run log boundaries and
+            parsed in parallel too. Defaults to 1, i.e. files are parsed
+            serially in this process. Pass None to use one process per CPU.
+        cache_dir (str, optional): Directory of a persistent cache of parsed
+            log files. Files which have not changed since they were cached are
+            loaded from the cache instead of being parsed. Defaults to None, not
+            using a cache.
+        cache_size (int, optional): Maximum size of the cache in bytes. The
+            least recently used entries are evicted beyond this size. Defaults
+            to 1GiB.
+        reader (str, optional): How log files are read. Possible values are
+            text, reading files in text mode, mmap, decoding large chunks
+            of a memory mapped file, and pipelined, where a background thread
+            reads, decompresses and splits chunks of each file into lines while
+            the previous ones are parsed. Both mmap and pipelined replace bytes
+            which are not valid UTF-8. Defaults to text.
+        progress (bool or set, optional): Sections (norel, rootlp, nodelog)
+            whose progress rows are collected for ParseResult.progress. Pass
+            False to only collect summary data, which is faster and uses much
+            less memory. Defaults to True, collecting all sections.
+        fast_summary (bool, optional): Only parse the head and the tail of large
+            MIP logs when the summary can be taken from them, which makes the
+            time taken independent of the length of the tree search. Other
+            files, such as those holding several run logs, are parsed
+            completely. Run logs hidden in the middle of a file are only
+            detected if it has a sidecar index (see scan). Implies
+            progress=False. Defaults to False.
+
+    """
+    if reader not in readers:
+        raise ValueError(f"Unknown reader '{reader}'")
+    sections = frozenset() if fast_summary else progress_sections(progress)
+    result = ParseResult()
+    if type(patterns) is str:
+        patterns = [patterns]
+    logfiles = sorted(set(glob_logfiles(patterns)))
+
+    parsed = {}
+    if cache_dir is not None:
+        cache = ParseCache(cache_dir, max_size=cache_size)
+        # Head and tail summaries must not be taken for full parses, nor
+        # parses replacing invalid bytes for strict ones
+        variants = []
+        if fast_summary:
+            variants.append("fast_summary")
+        if reader_errors[reader] != "strict":
+            variants.append(f"errors={reader_errors[reader]}")
+        variant = ":".join(variants) or None
+        keys = {logfile: cache.key(logfile, variant) for logfile in logfiles}
+        for logfile in logfiles:
+            parsers = cache.load(logfile, keys[logfile])
+            # Entries parsed without the requested progress are parsed again
+            if parsers is not None and all(
+                sections <= parser.progress_sections for _, _, parser in parsers
+            ):
+                parsed[logfile] = parsers
+
+    missing = [logfile for logfile in logfiles if logfile not in parsed]
+    parsed.update(
+        parse_logfiles(
+            missing,
+            jobs=jobs,
+            reader=reader,
+            progress_sections=sections,
+            fast_summary=fast_summary,
+        )
+    )
+
+    if cache_dir is not None and missing:
+        for logfile in missing:
+            cache.store(keys[logfile], parsed[logfile])
+        cache.evict()
+
+    # Collect results in the same order as a serial parse
+    for logfile in logfiles:
+        result.parsers.extend(parsed[logfile])
+    return result
+
+
+async def parse_logfile_async(
+    logfile: str, executor, progress_sections=PROGRESS_SECTIONS
+) -> list:
+    """Parse a single file read by the executor, see parse_logfile."""
+    parser = MultiLogParser(progress_sections=progress_sections)
+    batches = read_line_batches_async(logfile, executor)
+    try:
+        async for lines in batches:
+            for line in lines:
+                parser.parse(line)
+    finally:
+        # Close the file before the executor shuts down
+        await batches.aclose()
+    return number_runs(logfile, parser.parsers)
+
 
+async def parse_async(
+    patterns: Union[str, List[str]], concurrency: int = 16, progress=True
+) -> ParseResult:
+    """Parse log files on storage with a high latency, such as network mounts.
+
+    Files are opened and read in chunks by a thread pool, so that the reads of
+    up to concurrency files are in flight at the same time while the chunks
+    which arrived are parsed. The result is the same as that of parse(). As
+    with the mmap reader, bytes which are not valid UTF-8 are replaced.
+
+    Usage example:
+        result = asyncio.run(glt.parse_async("/mnt/logs/*.log", concurrency=32))
+
+    Args:
+        patterns (str): a single glob pattern, or list of patterns, matching
+            log files, see parse().
+        concurrency (int, optional): Number of files read at the same time.
+            Defaults to 16.
+        progress (bool or set, optional): Sections whose progress rows are
+            collected, see parse(). Defaults to True, collecting all sections.
     """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    sections = progress_sections(progress)
+    if type(patterns) is str:
+        patterns = [patterns]
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def parse_limited(logfile):
+        async with semaphore:
+            return await parse_logfile_async(logfile, executor, sections)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        logfiles = await loop.run_in_executor(
+            executor, lambda: sorted(set(glob_logfiles(patterns)))
+        )
+        tasks = [asyncio.ensure_future(parse_limited(logfile)) for logfile in logfiles]
+        try:
+            parsed = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop reading the other files if one of them failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     result = ParseResult()
+    for parsers in parsed:
+        result.parsers.extend(parsers)
+    return result
+
+
+def scan(patterns: Union[str, List[str]], index: bool = False) -> pd.DataFrame:
+    """Return an inventory of the run logs in the log files without parsing
+    them completely.
+
+    Only the header of each run log is parsed, up to the start of the presolve
+    output. Run logs are found by a pre-scan of the file for run boundaries, the
+    same one used to split large files for parallel parsing.
+
+    Args:
+        patterns (str): a single glob pattern, or list of patterns, matching
+            log files.
+        index (bool, optional): Write a sidecar index next to each log file
+            (named after it with a .glt.json suffix) holding the byte offsets of
+            each run log and its sections. Later parses use it instead of
+            scanning the file for run boundaries again. Defaults to False.
+
+    Returns:
+        pd.DataFrame: A row for each run log with its file path and number, the
+            header and model statistics (including the fingerprint), and the
+            changed parameters.
+    """
     if type(patterns) is str:
         patterns = [patterns]
-    logfiles = itertools.chain(*(glob.glob(pattern) for pattern in patterns))
-    for logfile in sorted(set(logfiles)):
-        result.parse(logfile)
+    rows = []
+    for logfile in sorted(set(glob_logfiles(patterns))):
+        parsers = scan_logfile(logfile, index=index)
+        for lognumber, parser in enumerate(parsers, start=1):
+            row = {"LogFilePath": logfile, "LogNumber": lognumber}
+            row.update(parser.header_parser.get_summary())
+            row.update(parser.presolve_parser.get_summary())
+            row.update(
+                {
+                    f"{name} (Parameter)": value
+                    for name, value in parser.header_parser.get_parameters().items()
+                }
+            )
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def progress_sections(progress) -> frozenset:
+    """Return the progress sections selected by the progress argument of
+    parse(), which is a bool, a section name or a collection of them."""
+    if progress is True:
+        return PROGRESS_SECTIONS
+    if progress is False:
+        return frozenset()
+    if type(progress) is str:
+        progress = [progress]
+    sections = frozenset(progress)
+    for section in sections - PROGRESS_SECTIONS:
+        raise ValueError(f"Unknown section '{section}'")
+    return sections
+
+
+def follow(logfile: str, progress_limit: int = None) -> ParseResult:
+    """Start following a log file which is still being written.
+
+    The returned result holds what has been written so far. Call its refresh()
+    method to parse newly appended lines.
+
+    Args:
+        logfile (str): Path of the log file to follow.
+        progress_limit (int, optional): Only keep this many of the most recent
+            rows of each progress table, so that a long running monitor stays
+            within a fixed amount of memory. Defaults to None, keeping all rows.
+    """
+    result = ParseResult()
+    result.follow(logfile, progress_limit=progress_limit)
     return result
 
 
-def get_dataframe(logfiles: List[str], timelines=False, prettyparams=False):
+def get_dataframe(
+    logfiles: List[str], timelines=False, prettyparams=False, compact=False
+):
     """Compatibility function for the legacy API.
 
     If one log file contains more than one run, all runs are parsed, each reported
@@ -173,13 +732,15 @@ def get_dataframe(logfiles: List[str], timelines=False, prettyparams=False):
             search tree progress if set to True. Defaults to False.
         prettyparams (bool, optional): Replace some parameter values with
             categorical labels.
+        compact (bool, optional): Store the timelines in the narrowest dtypes
+            holding their values, see ParseResult.progress. Defaults to False.
     """
-    result = parse(logfiles)
+    result = parse(logfiles, progress=timelines)
     summary = result.summary(prettyparams=prettyparams)
     if not timelines:
         return summary
     return summary, dict(
-        norel=result.progress("norel"),
-        rootlp=result.progress("rootlp"),
-        nodelog=result.progress("nodelog"),
+        norel=result.progress("norel", compact=compact),
+        rootlp=result.progress("rootlp", compact=compact),
+        nodelog=result.progress("nodelog", compact=compact),
     )
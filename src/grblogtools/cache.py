@@ -0,0 +1,127 @@
+"""Persistent on-disk cache of parsed log files.
+
+Each log file is stored in its own entry, keyed by the absolute path of the
+file, its size and modification time, and a parser version stamp. Entries for
+files which have since changed are removed when the new entry is stored, and
+the least recently used entries are evicted once the cache exceeds its maximum
+size.
+
+Entries are pickled, so only point the cache at a directory you trust.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import grblogtools
+
+# Bump this whenever the parsers change the data they produce
+CACHE_FORMAT = 3
+
+DEFAULT_CACHE_SIZE = 1 << 30
+
+
+class ParseCache:
+    def __init__(self, directory: str, max_size: int = DEFAULT_CACHE_SIZE):
+        """Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory (str): Directory holding the cache entries.
+            max_size (int, optional): Maximum total size of the cache entries
+                in bytes. Defaults to 1GiB. Pass None for no limit.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    def key(self, logfile: str, variant: str = None) -> str:
+        """Return the cache key identifying the current contents of the file.
+
+        The key is made of a hash of the file path and the variant, so that all
+        entries for a file can be found, and a hash of its size, mtime and the
+        parser version.
+
+        Args:
+            logfile (str): Path of the log file.
+            variant (str, optional): Name of a kind of parse whose results are
+                cached separately, such as summaries taken from the head and
+                the tail of the file, or parses replacing bytes which are not
+                valid UTF-8. Defaults to None, for full strict parses.
+        """
+        path = os.path.abspath(logfile)
+        stat = os.stat(path)
+        version = f"{grblogtools.__version__}:{CACHE_FORMAT}"
+        identity = f"{stat.st_size}:{stat.st_mtime_ns}:{version}"
+        owner = path if variant is None else f"{path}:{variant}"
+        return f"{digest(owner)}-{digest(identity)}"
+
+    def load(self, logfile: str, key: str):
+        """Return the (logfile, lognumber, parser) tuples of a cached log file,
+        or None if there is no valid entry for the given key."""
+        entry = self.directory.joinpath(f"{key}.pickle")
+        try:
+            with entry.open("rb") as infile:
+                parsers = pickle.load(infile)
+        except OSError:
+            return None
+        except (
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            # Corrupt entries, or entries referring to classes which were
+            # renamed or moved by another version of the package
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+            return None
+        # Mark the entry as recently used
+        os.utime(entry)
+        return [(logfile, lognumber, parser) for lognumber, parser in parsers]
+
+    def store(self, key: str, parsers: list) -> None:
+        """Store the (logfile, lognumber, parser) tuples of a parsed log file,
+        replacing any entries of the same variant for earlier versions of the
+        file."""
+        path_digest, _, _ = key.partition("-")
+        for stale in self.directory.glob(f"{path_digest}-*.pickle"):
+            stale.unlink()
+        data = [(lognumber, parser) for _, lognumber, parser in parsers]
+        # Write to a temporary file first so readers never see partial entries
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, suffix=".tmp", delete=False
+        ) as outfile:
+            pickle.dump(data, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(outfile.name, self.directory.joinpath(f"{key}.pickle"))
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits within
+        its maximum size."""
+        if self.max_size is None:
+            return
+        entries = []
+        for entry in self.directory.glob("*.pickle"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+def digest(text: str) -> str:
+    return hashlib.sha1(text.encode()).hexdigest()[:20]
@@ -1,18 +1,36 @@
 import argparse
 
-import pandas as pd
+from grblogtools.export import EXPORT_FORMATS, write_result, write_xlsx
+
+
+def job_count(value):
+    """Argparse type of -j/--jobs: a positive number, or 0 for all CPUs."""
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid job count: '{value}'")
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"job count must not be negative: {jobs}")
+    return jobs or None
 
 
 def cli(glt_parse, argparse_kwargs):
     """Entry point function for command line interface
 
     Args:
-        glt_parse: the parse function from grblogtools (in case overloads are needed)
+        glt_parse: the parse function from grblogtools (in case overloads are needed).
+            It is called with the log file patterns, and with the jobs, progress,
+            cache_dir and cache_size keyword arguments of grblogtools.parse only
+            where the options differ from its defaults.
         argparse_kwargs: extra info to pass to argparse
 
     """
     parser = argparse.ArgumentParser(**argparse_kwargs)
-    parser.add_argument("outfile", help="Output file name (.xlsx)", metavar="XLSXFILE")
+    parser.add_argument(
+        "outfile",
+        help="Output file name (.xlsx), or output directory for other formats",
+        metavar="OUTFILE",
+    )
     parser.add_argument(
         "logfiles", help="Gurobi log files", nargs="+", metavar="LOGFILE"
     )
@@ -22,14 +40,66 @@ def cli(glt_parse, argparse_kwargs):
         action="store_true",
         help="also store timelines (root LP, node log, and NoRel log) in separate sheets",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=job_count,
+        default=1,
+        help="number of worker processes parsing log files in parallel, 0 for "
+        "one per CPU (default: 1)",
+        metavar="N",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["xlsx", *EXPORT_FORMATS],
+        default="xlsx",
+        help="output format (default: xlsx). Other formats write one file per "
+        "sheet into the OUTFILE directory",
+    )
+    parser.add_argument(
+        "--partition-by",
+        help="comma separated columns to partition csv, jsonl, parquet and "
+        "feather outputs by, e.g. Version,Model",
+        metavar="COLUMNS",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="cache parsed log files in this directory and reuse unchanged ones",
+        metavar="DIR",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        help="maximum cache size in MiB, requires --cache-dir (default: 1024)",
+        metavar="MIB",
+    )
     args = parser.parse_args()
+    if args.cache_size is not None and args.cache_dir is None:
+        parser.error("--cache-size requires --cache-dir")
 
-    result = glt_parse(args.logfiles)
-    summary = result.summary()
-
-    with pd.ExcelWriter(args.outfile) as writer:
-        summary.to_excel(writer, sheet_name="Summary")
-        for tl in ["norel", "rootlp", "nodelog"]:
-            result.progress(tl).to_excel(writer, sheet_name=tl)
-
-    print(f"extracted {len(summary)} log(s) to {args.outfile}")
+    parse_kwargs = {}
+    if args.jobs != 1:
+        parse_kwargs["jobs"] = args.jobs
+    # Progress rows are only collected for timelines
+    if not args.timelines:
+        parse_kwargs["progress"] = False
+    if args.cache_dir is not None:
+        parse_kwargs["cache_dir"] = args.cache_dir
+        if args.cache_size is not None:
+            parse_kwargs["cache_size"] = args.cache_size << 20
+    result = glt_parse(args.logfiles, **parse_kwargs)
+    sections = None if args.timelines else []
+    if args.format == "xlsx":
+        write_xlsx(result, args.outfile, sections=sections)
+    else:
+        partition_by = None
+        if args.partition_by:
+            partition_by = args.partition_by.split(",")
+        write_result(
+            result,
+            args.outfile,
+            args.format,
+            partition_by=partition_by,
+            sections=sections,
+        )
+    print(f"extracted {len(result.parsers)} log(s) to {args.outfile}")
@@ -0,0 +1,438 @@
+"""Streaming export of parse results to CSV, JSON Lines, Parquet and Feather
+files.
+
+The summary and the progress of each section are written to separate files in
+an output directory. Progress rows are built and written for batches of runs,
+so that the progress rows of all runs are never held in memory at once. Since
+columns may be missing from the rows of some runs, their dtypes are determined
+from the progress tables of all runs before the first batch is written.
+
+Outputs can be partitioned by columns such as Version and Model, giving a
+directory per output with a subdirectory per value of each column, named as in
+Hive (e.g. nodelog/Version=9.5.0/Model=glass4/). The CSV and JSON Lines files
+of a partition are appended to, while Parquet and Feather partitions get a file
+for each batch.
+Parquet and Feather outputs require pyarrow.
+
+Excel workbooks are written by xlsxwriter in its constant memory mode, one
+worksheet per output. Progress sections with more rows than fit on a
+worksheet continue on overflow sheets.
+"""
+
+import datetime
+import os
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet", "feather")
+
+# Number of progress rows after which a batch of runs is written
+BATCH_ROWS = 1 << 18
+
+# Rows of an Excel worksheet, including the header row
+EXCEL_MAX_ROWS = 1 << 20
+
+# Directory name of missing partition values, as written by pyarrow
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def progress_dtypes(section: str, runs: list) -> dict:
+    """Return the dtypes of the columns of the progress rows of the runs.
+
+    Integer columns missing from some rows become floats, and columns holding
+    only None in some runs take the dtype of the other runs.
+    """
+    dtypes = {}
+    rows = 0
+    for _, _, parser in runs:
+        table = parser.get_progress_table(section)
+        if not len(table):
+            continue
+        table_dtypes = table.dtypes(unknown=None)
+        for name, dtype in dtypes.items():
+            if name not in table_dtypes or table_dtypes[name] is None:
+                dtypes[name] = missing_dtype(dtype)
+        for name, dtype in table_dtypes.items():
+            if dtype is None:
+                dtypes.setdefault(name, None)
+            elif dtypes.get(name) is not None:
+                dtypes[name] = np.result_type(dtypes[name], dtype)
+            elif rows:
+                dtypes[name] = missing_dtype(dtype)
+            else:
+                dtypes[name] = dtype
+        rows += len(table)
+    # Columns without any values
+    return {
+        name: np.dtype(object) if dtype is None else dtype
+        for name, dtype in dtypes.items()
+    }
+
+
+def missing_dtype(dtype):
+    """Return the dtype of a column which is missing some values."""
+    if dtype is None or dtype.kind not in "iub":
+        return dtype
+    return np.dtype(np.float64)
+
+
+def batches(section: str, runs: list, batch_rows: int = None):
+    """Split the runs into consecutive batches with at least batch_rows
+    progress rows, except the last one."""
+    if batch_rows is None:
+        batch_rows = BATCH_ROWS
+    start = rows = 0
+    for stop, (_, _, parser) in enumerate(runs, 1):
+        rows += len(parser.get_progress_table(section))
+        if rows >= batch_rows:
+            yield runs[start:stop]
+            start, rows = stop, 0
+    if start < len(runs):
+        yield runs[start:]
+
+
+def write_result(
+    result, path: str, format: str, partition_by=None, sections=None
+) -> None:
+    """Write the summary and the progress sections of the parse result to
+    files in the directory path.
+
+    Args:
+        result (ParseResult): The parse result to export.
+        path (str): Output directory, created if needed.
+        format (str): One of EXPORT_FORMATS.
+        partition_by (list, optional): Columns to partition the outputs by,
+            e.g. ["Version", "Model"]. Defaults to None, writing a single file
+            per output.
+        sections (list, optional): Progress sections to write. Defaults to the
+            sections whose progress was collected for all runs.
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{format}'")
+    partition_by = list(partition_by or [])
+    if sections is None:
+        sections = collected_sections(result)
+    os.makedirs(path, exist_ok=True)
+
+    # The summary has a single row per run and is written at once
+    summary = result.summary()
+    columns = list(summary.columns)
+    columns.extend(name for name in partition_by if name not in columns)
+    with open_writer(os.path.join(path, "summary"), format, partition_by) as writer:
+        writer.write(summary.reindex(columns=columns))
+
+    for section in sections:
+        dtypes = progress_frame_dtypes(result, section)
+        for name in partition_by:
+            dtypes.setdefault(name, np.dtype(object))
+        output = os.path.join(path, section)
+        with open_writer(output, format, partition_by, dtypes) as writer:
+            for progress in progress_batches(result, section, dtypes):
+                writer.write(progress)
+
+
+def write_xlsx(result, path: str, sections=None) -> None:
+    """Write the summary and the progress sections of the parse result to an
+    Excel workbook.
+
+    Rows are written as the progress frames of batches of runs are built, and
+    xlsxwriter flushes each row to disk once the next one is started. A
+    section with more rows than fit on a worksheet continues on overflow
+    sheets named after it, e.g. nodelog_2, nodelog_3, ...
+
+    Args:
+        result (ParseResult): The parse result to export.
+        path (str): Path of the workbook.
+        sections (list, optional): Progress sections to write. Defaults to the
+            sections whose progress was collected for all runs.
+    """
+    import xlsxwriter
+
+    if sections is None:
+        sections = collected_sections(result)
+    options = {"constant_memory": True, "nan_inf_to_errors": True}
+    with xlsxwriter.Workbook(path, options) as workbook:
+        summary = result.summary()
+        sheet = SheetWriter(workbook, "Summary", summary.columns)
+        sheet.write(summary)
+        for section in sections:
+            dtypes = progress_frame_dtypes(result, section)
+            sheet = SheetWriter(workbook, section, list(dtypes))
+            for progress in progress_batches(result, section, dtypes):
+                sheet.write(progress)
+
+
+class SheetWriter:
+    """Write rows to a worksheet and its overflow sheets, laid out as by
+    DataFrame.to_excel: a header row and the row number in the first column."""
+
+    def __init__(self, workbook, name: str, columns, max_rows: int = None):
+        self.workbook = workbook
+        self.name = name
+        self.columns = list(columns)
+        self.max_rows = EXCEL_MAX_ROWS if max_rows is None else max_rows
+        self.header_format = workbook.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        )
+        self.date_format = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+        self.sheets = 0
+        # Number of data rows written to all sheets
+        self.count = 0
+        self.add_sheet()
+
+    def add_sheet(self) -> None:
+        """Start the next sheet with the header row."""
+        self.sheets += 1
+        name = self.name if self.sheets == 1 else f"{self.name}_{self.sheets}"
+        self.sheet = self.workbook.add_worksheet(name)
+        for col, column in enumerate(self.columns, 1):
+            self.sheet.write_string(0, col, str(column), self.header_format)
+        self.row = 1
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Append the rows of the frame, whose columns are those of the
+        sheet."""
+        for values in frame.itertuples(index=False, name=None):
+            if self.row == self.max_rows:
+                self.add_sheet()
+            self.sheet.write_number(self.row, 0, self.count, self.header_format)
+            for col, value in enumerate(values, 1):
+                self.write_cell(col, value)
+            self.row += 1
+            self.count += 1
+
+    def write_cell(self, col: int, value) -> None:
+        """Write a single value, leaving missing values blank."""
+        if value is None or value != value:
+            return
+        if isinstance(value, str):
+            self.sheet.write_string(self.row, col, value)
+        elif isinstance(value, datetime.datetime):
+            self.sheet.write_datetime(self.row, col, value, self.date_format)
+        elif isinstance(value, (bool, np.bool_)):
+            self.sheet.write_boolean(self.row, col, bool(value))
+        elif isinstance(value, (int, float, np.number)):
+            self.sheet.write_number(self.row, col, value)
+        else:
+            self.sheet.write_string(self.row, col, str(value))
+
+
+def collected_sections(result) -> list:
+    """Return the progress sections collected for all runs of the result."""
+    return [
+        section
+        for section in ("norel", "rootlp", "nodelog")
+        if all(section in parser.progress_sections for _, _, parser in result.parsers)
+    ]
+
+
+def progress_frame_dtypes(result, section: str) -> dict:
+    """Return the dtypes of the columns of the progress frame of the section,
+    including the data joined from each run."""
+    dtypes = progress_dtypes(section, result.parsers)
+    dtypes.update(result.common_log_data().dtypes.items())
+    return dtypes
+
+
+def progress_batches(result, section: str, dtypes: dict):
+    """Yield the progress frames of the section for batches of runs, with the
+    columns of the given dtypes."""
+    for runs in batches(section, result.parsers):
+        progress = result._subset(runs).progress(section)
+        yield progress.reindex(columns=list(dtypes)).astype(dtypes)
+
+
+def open_writer(path: str, format: str, partition_by: list, dtypes=None):
+    """Return the writer of an output at path, without the file extension.
+    Columns are written with the given dtypes, or those of the first frame."""
+    if format == "csv":
+        return CsvWriter(path, partition_by)
+    if format == "jsonl":
+        return JsonlWriter(path, partition_by)
+    return ArrowWriter(path, format, partition_by, dtypes)
+
+
+def partition_dir(keys) -> str:
+    """Return the relative directory of a partition, given its column names
+    and values."""
+    return os.path.join(
+        *(
+            f"{name}={NULL_PARTITION if pd.isna(value) else quote(str(value), safe='')}"
+            for name, value in keys
+        )
+    )
+
+
+class OutputWriter:
+    """Write frames to a single file, or to files in a directory per partition.
+
+    Subclasses write the files: write_file is called for the single file of an
+    output which is not partitioned, write_part for the rows of each partition
+    in each frame.
+    """
+
+    extension = None
+
+    def __init__(self, path: str, partition_by: list):
+        self.path = path
+        self.partition_by = partition_by
+        # Number of frames written so far
+        self.batch = 0
+        if partition_by and os.path.isdir(path) and os.listdir(path):
+            raise FileExistsError(f"Partitioned output directory {path} is not empty")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if not self.partition_by:
+            self.write_file(f"{self.path}.{self.extension}", frame)
+        else:
+            groups = frame.groupby(self.partition_by, dropna=False, sort=False)
+            for keys, group in groups:
+                if len(self.partition_by) == 1:
+                    keys = (keys,)
+                directory = os.path.join(
+                    self.path, partition_dir(zip(self.partition_by, keys))
+                )
+                os.makedirs(directory, exist_ok=True)
+                self.write_part(directory, group.drop(columns=self.partition_by))
+        self.batch += 1
+
+    def close(self) -> None:
+        pass
+
+
+class CsvWriter(OutputWriter):
+    """Write frames to a CSV file, or to a CSV file per partition."""
+
+    extension = "csv"
+
+    def __init__(self, path: str, partition_by: list):
+        super().__init__(path, partition_by)
+        # Files which already have a header
+        self.started = set()
+
+    def write_file(self, filename: str, frame: pd.DataFrame) -> None:
+        header = filename not in self.started
+        frame.to_csv(filename, mode="w" if header else "a", header=header, index=False)
+        self.started.add(filename)
+
+    def write_part(self, directory: str, frame: pd.DataFrame) -> None:
+        self.write_file(os.path.join(directory, "part-0.csv"), frame)
+
+
+class JsonlWriter(OutputWriter):
+    """Write frames to a JSON Lines file, or to a JSON Lines file per
+    partition. Each row is a JSON object, with missing values as null and
+    dates in ISO format."""
+
+    extension = "jsonl"
+
+    def __init__(self, path: str, partition_by: list):
+        super().__init__(path, partition_by)
+        # Files which were truncated when first written to
+        self.started = set()
+
+    def write_file(self, filename: str, frame: pd.DataFrame) -> None:
+        mode = "a" if filename in self.started else "w"
+        text = ""
+        if len(frame):
+            text = frame.to_json(orient="records", lines=True, date_format="iso")
+            # Older pandas versions leave out the final newline
+            if not text.endswith("\n"):
+                text += "\n"
+        with open(filename, mode) as outfile:
+            outfile.write(text)
+        self.started.add(filename)
+
+    def write_part(self, directory: str, frame: pd.DataFrame) -> None:
+        self.write_file(os.path.join(directory, "part-0.jsonl"), frame)
+
+
+class ArrowWriter(OutputWriter):
+    """Write frames to a Parquet or Feather file, or to a file per partition
+    and frame."""
+
+    def __init__(self, path: str, format: str, partition_by: list, dtypes=None):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                f"Writing {format} files requires pyarrow, install it with "
+                "pip install grblogtools[arrow]"
+            ) from None
+        super().__init__(path, partition_by)
+        self.extension = format
+        self.schema = None
+        if dtypes is not None:
+            self.schema = arrow_schema(
+                {
+                    name: dtype
+                    for name, dtype in dtypes.items()
+                    if name not in partition_by
+                }
+            )
+        self.writer = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self.schema is None:
+            # All partitions get the schema inferred from the first frame
+            import pyarrow as pa
+
+            schema = pa.Schema.from_pandas(frame, preserve_index=False)
+            for name in self.partition_by:
+                schema = schema.remove(schema.get_field_index(name))
+            self.schema = schema.remove_metadata()
+        super().write(frame)
+
+    def table(self, frame: pd.DataFrame):
+        """Convert the frame to a pyarrow table with the declared schema."""
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False)
+
+    def write_file(self, filename: str, frame: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = self.table(frame)
+        if self.writer is None:
+            if self.extension == "parquet":
+                self.writer = pq.ParquetWriter(filename, table.schema)
+            else:
+                self.writer = pa.ipc.new_file(filename, table.schema)
+        self.writer.write_table(table)
+
+    def write_part(self, directory: str, frame: pd.DataFrame) -> None:
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+
+        filename = os.path.join(directory, f"part-{self.batch}.{self.extension}")
+        if self.extension == "parquet":
+            pq.write_table(self.table(frame), filename)
+        else:
+            feather.write_feather(self.table(frame), filename)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+def arrow_schema(dtypes: dict):
+    """Return the pyarrow schema of columns with the given dtypes. Object
+    columns hold text."""
+    import pyarrow as pa
+
+    fields = []
+    for name, dtype in dtypes.items():
+        if dtype == object:
+            fields.append(pa.field(name, pa.string()))
+        else:
+            fields.append(pa.field(name, pa.from_numpy_dtype(dtype)))
+    return pa.schema(fields)
@@ -0,0 +1,106 @@
+"""Summaries of large MIP logs taken from the head and the tail of the file.
+
+The header, presolve, NoRel and root relaxation data of a MIP log come before
+the tree search, while the final statistics, cuts and termination status come
+after it. If the head of the file reaches the tree search and the tail starts
+within it, only the head and the tail need to be parsed for the summary; the
+table rows in between do not contribute to it.
+
+Only files holding a single run log are summarized this way, as other run logs
+could be hidden in the skipped middle of the file. Without reading the middle,
+this is checked from the buffers: the head and the tail may not start another
+run log, and the first table row of the tail has to continue the last one of
+the head (node count and time do not decrease). A run log hidden completely
+in the middle of a table which does continue is only detected by an up to date
+sidecar index (see api.scan), which is used when present.
+"""
+
+import io
+import os
+
+from grblogtools.parsers.multi_log import MultiLogParser
+from grblogtools.readers import compression_opener, reader_errors
+from grblogtools.segments import read_index
+
+FAST_SUMMARY_SIZE = 1 << 18
+
+
+def continues(head_row: dict, tail_row: dict) -> bool:
+    """Check whether the tail row can follow the head row in the same table."""
+    return all(
+        tail_row[key] >= head_row[key]
+        for key in ("CurrentNode", "Time")
+        if head_row.get(key) is not None and tail_row.get(key) is not None
+    )
+
+
+def parse_head_tail(logfile: str, reader: str = "text", size: int = None):
+    """Parse only the first and last bytes of the log file.
+
+    Args:
+        logfile (str): Path of the log file.
+        reader (str, optional): Reader whose handling of bytes which are not
+            valid UTF-8 is used. Defaults to text.
+        size (int, optional): Number of bytes read at each end of the file.
+            Defaults to FAST_SUMMARY_SIZE.
+
+    Returns:
+        list: The parser of the single run log in the file, which does not
+            collect progress rows, or None if the file has to be parsed
+            completely.
+    """
+    if size is None:
+        size = FAST_SUMMARY_SIZE
+    file_size = os.path.getsize(logfile)
+    if file_size <= 2 * size or compression_opener(logfile) is not None:
+        return None
+    runs = read_index(logfile)
+    if runs is not None and len(runs) != 1:
+        return None
+
+    with open(logfile, "rb") as infile:
+        head = infile.read(size)
+        infile.seek(file_size - size)
+        tail = infile.read()
+    head = head[: head.rfind(b"\n") + 1]
+    tail = tail[tail.find(b"\n") + 1 :]
+    errors = reader_errors[reader]
+    head_lines = io.StringIO(head.decode(errors=errors), newline=None).readlines()
+    tail_lines = io.StringIO(tail.decode(errors=errors), newline=None)
+
+    parser = MultiLogParser(progress_sections=())
+    for line in head_lines:
+        parser.parse(line)
+    if len(parser.parsers) != 1:
+        return None
+
+    # The head must end within the tree search table of the last run log
+    last = parser.parsers[-1]
+    if (
+        last.current_parser is not last.nodelog_parser
+        or not last.nodelog_parser.started
+        or "Runtime" in last.nodelog_parser.get_summary()
+    ):
+        return None
+
+    # The tail must start within the same table, after the last head row
+    head_row = None
+    for line in reversed(head_lines):
+        head_row = last.nodelog_parser.parse_row(line)
+        if head_row is not None:
+            break
+    if head_row is None:
+        return None
+    for line in tail_lines:
+        if line.strip():
+            tail_row = last.nodelog_parser.parse_row(line)
+            if tail_row is None or not continues(head_row, tail_row):
+                return None
+            parser.parse(line)
+            break
+    for line in tail_lines:
+        parser.parse(line)
+
+    if len(parser.parsers) != 1 or parser.parsers[-1] is not last:
+        return None
+    return parser.parsers
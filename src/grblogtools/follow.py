@@ -0,0 +1,102 @@
+"""Incremental parsing of log files which are still being written.
+
+Usage example:
+    import grblogtools as glt
+    result = glt.follow("running.log", progress_limit=100000)
+    ...
+    result.refresh()
+    result.progress("nodelog")
+"""
+
+import os
+
+from grblogtools.parsers.multi_log import MultiLogParser
+
+
+class LogFollower:
+    """Parse a log file in steps, each step only reading the appended bytes.
+
+    The parser state and the file offset are kept between calls to refresh. A
+    partial final line is held back until the rest of it has been written. If
+    the file was truncated or replaced since the last call, parsing starts over
+    with a new parser.
+    """
+
+    chunk_size = 1 << 20
+
+    # Number of bytes before the offset compared to detect rewritten files
+    check_size = 256
+
+    def __init__(self, logfile: str, progress_limit=None):
+        """Initialize the follower. No data is read until refresh is called.
+
+        Args:
+            logfile (str): Path of the log file to follow.
+            progress_limit (int, optional): Only keep this many of the most
+                recent rows of each progress table, so that memory use stays
+                bounded for long running solves. Defaults to None, keeping all
+                rows.
+        """
+        self.logfile = logfile
+        self._progress_limit = progress_limit
+        self._restart()
+
+    def _restart(self) -> None:
+        self.parser = MultiLogParser(progress_limit=self._progress_limit)
+        # Bytes read so far, of which the last few are kept to detect changes
+        self.offset = 0
+        self._last_bytes = b""
+        self._identity = None
+        self._partial = b""
+        self._reported = 0
+
+    def _rewritten(self, infile, identity: tuple, size: int) -> bool:
+        """Return whether the open file is not the one read so far, because it
+        was replaced, truncated or rewritten."""
+        if not self.offset:
+            return False
+        if identity != self._identity or size < self.offset:
+            return True
+        infile.seek(self.offset - len(self._last_bytes))
+        return infile.read(len(self._last_bytes)) != self._last_bytes
+
+    def refresh(self) -> list:
+        """Parse all complete lines appended since the last call.
+
+        If the file was truncated or replaced, it is parsed again from the
+        start, and the parser attribute holds a new parser. The runs read from
+        the file before are not reported again.
+
+        Returns:
+            list: A (logfile, lognumber, parser) tuple for each run log started
+                since the last call. The parsers of earlier run logs keep being
+                updated in place.
+        """
+        with open(self.logfile, "rb") as infile:
+            stat = os.fstat(infile.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            if self._rewritten(infile, identity, stat.st_size):
+                self._restart()
+            self._identity = identity
+            infile.seek(self.offset)
+            while True:
+                chunk = infile.read(self.chunk_size)
+                if not chunk:
+                    break
+                self.offset += len(chunk)
+                self._last_bytes = (self._last_bytes + chunk)[-self.check_size :]
+                lines = (self._partial + chunk).split(b"\n")
+                self._partial = lines.pop()
+                for line in lines:
+                    if line.endswith(b"\r"):
+                        line = line[:-1]
+                    self.parser.parse(line.decode(errors="replace") + "\n")
+
+        runs = [
+            (self.logfile, lognumber, parser)
+            for lognumber, parser in enumerate(
+                self.parser.parsers[self._reported :], start=self._reported + 1
+            )
+        ]
+        self._reported = len(self.parser.parsers)
+        return runs
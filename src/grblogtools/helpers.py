@@ -1,52 +1,65 @@
 import re
-from functools import partial
 from pathlib import Path
 
-from grblogtools.parameters import load_defaults, load_descriptions
+import numpy as np
+import pandas as pd
+
+from grblogtools.parameters import load_defaults_matrix, load_descriptions
+from grblogtools.readers import compression_suffixes
 
 re_parameter_column = re.compile(r"(.*) \(Parameter\)")
 
 
-def fill_for_version(group, parameter_columns):
-    parameter_defaults = load_defaults(
-        version=group["Version"].iloc[0].replace(".", "")
-    )
-    for column in parameter_columns:
-        default = parameter_defaults.get(re_parameter_column.match(column).group(1))
-        if default is not None:
-            group[column] = group[column].fillna(default).astype(type(default))
-    return group
+def fill_defaults(frame, parameter_columns):
+    """Fill missing values in the given columns with the default value for the
+    Version of each row, falling back to the 950 defaults for unknown versions.
+
+    Columns are cast to the type of the defaults, as long as the defaults for
+    all rows exist and have the same type. Rows without a Version are left as
+    they are.
+
+    Args:
+        frame (pd.DataFrame): A frame with a Version column.
+        parameter_columns (dict): The parameter name for each column to fill.
+    """
+    defaults, integer = load_defaults_matrix()
+    versions = frame["Version"].str.replace(".", "", regex=False)
+    has_version = versions.notna().to_numpy()
+    codes = defaults.index.get_indexer(versions)
+    codes[(codes == -1) & has_version] = defaults.index.get_loc("950")
+
+    # Collect the filled columns and build the frame once, setting columns one
+    # by one is slow on wide frames
+    columns = dict(frame.items())
+    for column, parameter in parameter_columns.items():
+        if parameter not in defaults.columns:
+            continue
+        values = defaults[parameter].to_numpy()[codes]
+        values[~has_version] = np.nan
+        filled = frame[column]
+        missing = filled.isna().to_numpy()
+        if missing.any():
+            filled = filled.where(~missing, values)
+        if not np.isnan(values).any():
+            is_integer = integer[parameter].to_numpy()[codes]
+            filled = filled.astype(int if is_integer.all() else float)
+        columns[column] = filled
+    return pd.DataFrame(columns, index=frame.index)
 
 
 def fill_default_parameters(summary):
     """Fill NaN parameter values with the actual default value."""
-    parameter_columns = [
-        column
-        for column, series in summary.items()
-        if re_parameter_column.match(column) and series.isnull().any()
-    ]
-    # TODO test cases where there are different versions involved
-    return summary.groupby("Version", group_keys=False).apply(
-        partial(fill_for_version, parameter_columns=parameter_columns)
-    )
-
-
-def fill_for_version_nosuffix(group):
-    parameter_defaults = load_defaults(
-        version=group["Version"].iloc[0].replace(".", "")
-    )
-    for parameter in group.columns:
-        default = parameter_defaults.get(parameter)
-        if default is not None:
-            group[parameter] = group[parameter].fillna(default).astype(type(default))
-    return group
+    parameter_columns = {}
+    for column, series in summary.items():
+        match = re_parameter_column.match(column)
+        if match and series.isnull().any():
+            parameter_columns[column] = match.group(1)
+    return fill_defaults(summary, parameter_columns)
 
 
 def fill_default_parameters_nosuffix(parameters):
     """Fill defaults for Version and parameter cols with no (Parameter) suffix."""
-    return parameters.groupby("Version", group_keys=False).apply(
-        fill_for_version_nosuffix
-    )
+    return fill_defaults(parameters, {column: column for column in parameters.columns})
 
 
 def add_categorical_descriptions(summary):
@@ -70,10 +83,14 @@ def strip_model_and_seed(row):
     i.e. with Model = 'glass4'
         data/912-Cuts0-glass4-0.log -> 912-Cuts0
         data/some-log.log -> some-log
+        data/some-log.log.gz -> some-log
     """
     if row["Model"] is None:
         return None
-    log_stem = Path(row["LogFilePath"]).stem
+    log_path = Path(row["LogFilePath"])
+    if log_path.suffix in compression_suffixes:
+        log_path = log_path.with_suffix("")
+    log_stem = log_path.stem
     run, mid, _ = log_stem.partition(row["Model"])
     if mid and run:
         return run.rstrip("-")
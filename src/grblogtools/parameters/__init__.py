@@ -1,2 +1,2 @@
-from grblogtools.parameters.defaults import load_defaults
+from grblogtools.parameters.defaults import load_defaults, load_defaults_matrix
 from grblogtools.parameters.pretty import load_descriptions
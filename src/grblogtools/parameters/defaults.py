@@ -2,6 +2,8 @@ import json
 from functools import lru_cache
 from pathlib import Path
 
+import pandas as pd
+
 data_dir = Path(__file__).parent.joinpath("data")
 
 
@@ -13,3 +15,29 @@ def load_defaults(version):
         version_file = data_dir.joinpath("950.json")
     with version_file.open() as infile:
         return json.load(infile)
+
+
+@lru_cache()
+def load_defaults_matrix():
+    """Load the defaults of all versions at once.
+
+    Returns:
+        tuple: A frame of the default values, indexed by version (as in the
+            data file names) with a column per parameter, and a boolean frame of
+            the same shape flagging integer defaults. Parameters which do not
+            exist in a version are NaN and False, respectively.
+    """
+    defaults = {}
+    for version_file in sorted(data_dir.glob("[0-9]*.json")):
+        with version_file.open() as infile:
+            defaults[version_file.stem] = json.load(infile)
+    matrix = pd.DataFrame.from_dict(defaults, orient="index", dtype=float)
+    integer = pd.DataFrame.from_dict(
+        {
+            version: {name: type(value) is int for name, value in values.items()}
+            for version, values in defaults.items()
+        },
+        orient="index",
+    )
+    integer = integer.reindex_like(matrix).fillna(False).astype(bool)
+    return matrix, integer
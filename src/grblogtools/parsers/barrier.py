@@ -1,6 +1,7 @@
 import re
 
-from grblogtools.parsers.util import float_pattern, typeconvert_groupdict
+from grblogtools.parsers.progress import ProgressTable
+from grblogtools.parsers.util import NUMBER_KEY, float_pattern, typeconvert_groupdict
 
 
 class BarrierParser:
@@ -41,10 +42,21 @@ class BarrierParser:
         ),
     ]
 
-    def __init__(self):
-        """Initialize the Barrier parser."""
+    # Line keys (see util.line_key) of all the above patterns
+    line_keys = frozenset({"Iter", "Ordering", NUMBER_KEY, "Push", "Barrier"})
+
+    def __init__(self, progress_limit=None, collect=True):
+        """Initialize the Barrier parser.
+
+        Args:
+            progress_limit (int, optional): Only keep this many of the most
+                recent progress rows. Defaults to None, keeping all rows.
+            collect (bool, optional): Collect progress rows. Pass False to only
+                track the parser state. Defaults to True.
+        """
         self._summary = {}
-        self._progress = []
+        self._progress = ProgressTable(maxlen=progress_limit)
+        self._collect = collect
         self._started = False
 
     def parse(self, line: str) -> bool:
@@ -70,6 +82,8 @@ class BarrierParser:
 
         progress_match = BarrierParser.barrier_progress_pattern.match(line)
         if progress_match:
+            if not self._collect:
+                return True
             entry = {"Type": "barrier"}
             entry.update(typeconvert_groupdict(progress_match))
             self._progress.append(entry)
@@ -94,4 +108,8 @@ class BarrierParser:
 
     def get_progress(self) -> list:
         """Return the detailed progress in the barrier method."""
+        return self._progress.to_records()
+
+    def get_progress_table(self) -> ProgressTable:
+        """Return the detailed progress in the barrier method in columnar form."""
         return self._progress
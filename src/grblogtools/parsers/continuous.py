@@ -1,6 +1,7 @@
 import re
 
 from grblogtools.parsers.barrier import BarrierParser
+from grblogtools.parsers.progress import ProgressTable
 from grblogtools.parsers.simplex import SimplexParser
 from grblogtools.parsers.util import typeconvert_groupdict
 
@@ -24,10 +25,25 @@ class ContinuousParser:
         re.compile(r"(?P<OPTIMAL>Optimal objective\s+(?P<ObjVal>.*))$"),
     ]
 
-    def __init__(self):
-        """Initialize the Continuous parser."""
-        self._barrier_parser = BarrierParser()
-        self._simplex_parser = SimplexParser()
+    # Line keys (see util.line_key) of the above patterns and the sub-parsers
+    line_keys = (
+        frozenset({"Root", "Barrier", "Sub-optimal", "Optimal"})
+        | BarrierParser.line_keys
+        | SimplexParser.line_keys
+    )
+
+    def __init__(self, progress_limit=None, collect=True):
+        """Initialize the Continuous parser.
+
+        Args:
+            progress_limit (int, optional): Only keep this many of the most
+                recent barrier and simplex progress rows (each). Defaults to
+                None, keeping all rows.
+            collect (bool, optional): Collect progress rows. Pass False to only
+                track the parser state. Defaults to True.
+        """
+        self._barrier_parser = BarrierParser(progress_limit, collect)
+        self._simplex_parser = SimplexParser(progress_limit, collect)
 
         self._summary = {}
 
@@ -97,3 +113,9 @@ class ContinuousParser:
     def get_progress(self) -> list:
         """Return the detailed progress in the continuous method."""
         return self._barrier_parser.get_progress() + self._simplex_parser.get_progress()
+
+    def get_progress_table(self) -> ProgressTable:
+        """Return the detailed progress in the continuous method in columnar form."""
+        result = self._barrier_parser.get_progress_table().copy()
+        result.extend(self._simplex_parser.get_progress_table())
+        return result
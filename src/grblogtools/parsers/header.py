@@ -1,6 +1,10 @@
 import re
 
-from grblogtools.parsers.util import convert_data_types, typeconvert_groupdict
+from grblogtools.parsers.util import (
+    CombinedPattern,
+    convert_data_types,
+    typeconvert_dict,
+)
 
 
 class HeaderParser:
@@ -32,11 +36,19 @@ class HeaderParser:
         ),
     ]
 
+    # Each pattern list is matched with a single regex call
+    header_start_regex = CombinedPattern(header_start_patterns)
+    header_other_regex = CombinedPattern(header_other_patterns)
+
     # Special case for parameter changes
     parameter_change_pattern = re.compile(
         r"Set parameter (?P<ParamName>[^\s]+) to value (?P<ParamValue>.*)$"
     )
 
+    # Line keys (see util.line_key) which can match before the header starts.
+    # Once started, the model name pattern can match any line.
+    line_keys = frozenset({"Set", "Gurobi", "Logging", "Compute"})
+
     def __init__(self):
         """Initialize the Header parser.
 
@@ -63,19 +75,18 @@ class HeaderParser:
             )
             return True
 
-        for pattern in HeaderParser.header_start_patterns:
-            match = pattern.match(line)
-            if match:
-                self._started = True
-                self._summary.update(typeconvert_groupdict(match))
-                return True
+        match = HeaderParser.header_start_regex.match(line)
+        if match:
+            self._started = True
+            self.line_keys = None
+            self._summary.update(typeconvert_dict(match[1]))
+            return True
 
         if self._started:
-            for pattern in HeaderParser.header_other_patterns:
-                match = pattern.match(line)
-                if match:
-                    self._summary.update(typeconvert_groupdict(match))
-                    return True
+            match = HeaderParser.header_other_regex.match(line)
+            if match:
+                self._summary.update(typeconvert_dict(match[1]))
+                return True
 
         return False
 
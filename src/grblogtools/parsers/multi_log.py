@@ -0,0 +1,54 @@
+from grblogtools.parsers.single_log import PROGRESS_SECTIONS, SingleLogParser
+
+
+class MultiLogParser:
+    """This class parses a log file which may contain several run logs.
+
+    It expects parse to be called once for each line in a log file. Lines not
+    matched by the current run log are checked by an empty parser, which starts
+    a new run log if it matches a header line.
+    """
+
+    def __init__(self, progress_limit=None, progress_sections=PROGRESS_SECTIONS):
+        """Initialize the parser.
+
+        Args:
+            progress_limit (int, optional): Only keep this many of the most
+                recent rows of each progress table in each run log. Defaults
+                to None, keeping all rows.
+            progress_sections (set, optional): Sections whose progress rows are
+                collected. Defaults to all sections.
+        """
+        self._progress_limit = progress_limit
+        self._progress_sections = progress_sections
+        self._subsequent = self._new_parser()
+        # The run logs found so far. The last one is still being parsed.
+        self.parsers = [self._new_parser()]
+
+    def _new_parser(self) -> SingleLogParser:
+        return SingleLogParser(
+            progress_limit=self._progress_limit,
+            progress_sections=self._progress_sections,
+        )
+
+    def parse(self, line: str) -> bool:
+        """Parse the given log line, starting a new run log if needed.
+
+        Args:
+            line (str): A line in the log file.
+
+        Returns:
+            bool: Return True if the given line is matched by some pattern.
+        """
+        if self.parsers[-1].parse(line):
+            return True
+
+        assert not self._subsequent.started
+        if self._subsequent.parse(line):
+            # The current parser did not match but an empty parser matched a
+            # header line.
+            self.parsers.append(self._subsequent)
+            self._subsequent = self._new_parser()
+            return True
+
+        return False
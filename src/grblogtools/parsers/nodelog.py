@@ -1,10 +1,56 @@
 import re
 
-from grblogtools.parsers.util import (
-    convert_data_types,
-    float_pattern,
-    typeconvert_groupdict,
-)
+from grblogtools.parsers.progress import ProgressTable
+from grblogtools.parsers.util import NUMBER_KEY, float_pattern, typeconvert_groupdict
+
+# Converters for the tokens of node log table rows. Each one accepts exactly the
+# tokens matched by the corresponding group in NodeLogParser.line_types and
+# returns the same value as util.convert_field, or raises a ValueError.
+
+float_chars = "0123456789.eE+-"
+
+
+def convert_int(token):
+    if not token.isdigit():
+        raise ValueError(token)
+    return int(token)
+
+
+def convert_float(token):
+    if token.strip(float_chars):
+        raise ValueError(token)
+    return float(token)
+
+
+def convert_float_or_dash(token):
+    if token == "-":
+        return None
+    return convert_float(token)
+
+
+def convert_percentage(token):
+    number = token[:-1]
+    if token[-1:] != "%" or number.strip(float_chars):
+        raise ValueError(token)
+    return float(number) / 100
+
+
+def convert_percentage_or_dash(token):
+    if token == "-":
+        return None
+    return convert_percentage(token)
+
+
+def convert_seconds(token):
+    if token[-1:] != "s":
+        raise ValueError(token)
+    return convert_int(token[:-1])
+
+
+def convert_pruned(token):
+    if token not in ("cutoff", "infeasible", "postponed"):
+        raise ValueError(token)
+    return token
 
 
 class NodeLogParser:
@@ -50,16 +96,82 @@ class NodeLogParser:
             )
         ),
     ]
+
+    # Columns of the above row types used by the tokenizer fast path, keyed by
+    # the number of tokens after the new solution marker (if any).
+    row_columns = {
+        None: {
+            10: [
+                ("CurrentNode", convert_int),
+                ("RemainingNodes", convert_int),
+                ("Obj", convert_float),
+                ("Depth", convert_int),
+                ("IntInf", convert_int),
+                ("Incumbent", convert_float_or_dash),
+                ("BestBd", convert_float),
+                ("Gap", convert_percentage_or_dash),
+                ("ItPerNode", convert_float_or_dash),
+                ("Time", convert_seconds),
+            ],
+            9: [
+                ("CurrentNode", convert_int),
+                ("RemainingNodes", convert_int),
+                ("Pruned", convert_pruned),
+                ("Depth", convert_int),
+                ("Incumbent", convert_float_or_dash),
+                ("BestBd", convert_float),
+                ("Gap", convert_percentage_or_dash),
+                ("ItPerNode", convert_float_or_dash),
+                ("Time", convert_seconds),
+            ],
+        },
+        "H": {
+            7: [
+                ("CurrentNode", convert_int),
+                ("RemainingNodes", convert_int),
+                ("Incumbent", convert_float_or_dash),
+                ("BestBd", convert_float),
+                ("Gap", convert_percentage),
+                ("ItPerNode", convert_float_or_dash),
+                ("Time", convert_seconds),
+            ],
+        },
+        "*": {
+            8: [
+                ("CurrentNode", convert_int),
+                ("RemainingNodes", convert_int),
+                ("Depth", convert_int),
+                ("Incumbent", convert_float_or_dash),
+                ("BestBd", convert_float),
+                ("Gap", convert_percentage),
+                ("ItPerNode", convert_float_or_dash),
+                ("Time", convert_seconds),
+            ],
+        },
+    }
+
     cut_report_start = re.compile(r"Cutting planes:")
     cut_report_line = re.compile(r"  (?P<Name>[\w\- ]+): (?P<Count>\d+)")
 
-    def __init__(self):
-        """Initialize the NodeLog parser."""
+    # Line keys (see util.line_key) of all the above patterns. Once the cut
+    # report starts, cut names can match any line.
+    line_keys = frozenset({"Explored", "Best", "Cutting", "Expl", NUMBER_KEY, "H", "*"})
+
+    def __init__(self, progress_limit=None, collect=True):
+        """Initialize the NodeLog parser.
+
+        Args:
+            progress_limit (int, optional): Only keep this many of the most
+                recent progress rows. Defaults to None, keeping all rows.
+            collect (bool, optional): Collect progress rows. Pass False to only
+                track the parser state. Defaults to True.
+        """
         self._summary = {}
         self._cuts = {}
-        self._progress = []
+        self._progress = ProgressTable(maxlen=progress_limit)
+        self._collect = collect
         self._in_cut_report = False
-        self._started = False
+        self.started = False
 
     def get_summary(self) -> dict:
         """Return the current parsed summary."""
@@ -76,6 +188,17 @@ class NodeLogParser:
         Returns:
             bool: Return True if the given line is matched by some pattern.
         """
+        # Table rows make up most of the log, so try the fast path first. Rows
+        # cannot be matched by any of the other patterns.
+        if self.started:
+            if not self._collect:
+                if self.match_row(line):
+                    return True
+            else:
+                entry = self.parse_row(line)
+                if entry is not None:
+                    self._progress.append(entry)
+                    return True
 
         for regex in self.tree_search_final_stats:
             match = regex.match(line)
@@ -87,21 +210,20 @@ class NodeLogParser:
         match = self.cut_report_start.match(line)
         if match:
             self._in_cut_report = True
+            self.line_keys = None
             return True
 
         if self._in_cut_report:
             match = self.cut_report_line.match(line)
             if match:
-                self._cuts[match.group("Name")] = convert_data_types(
-                    match.group("Count")
-                )
+                self._cuts[match.group("Name")] = int(match.group("Count"))
                 return True
 
         # Wait for the header before matching any log lines.
-        if not self._started:
+        if not self.started:
             match = self.tree_search_start.match(line)
             if match:
-                self._started = True
+                self.started = True
                 return True
             return False
 
@@ -109,23 +231,72 @@ class NodeLogParser:
         for regex in self.line_types:
             match = regex.match(line)
             if match:
-                self._progress.append(typeconvert_groupdict(match))
+                if self._collect:
+                    self._progress.append(typeconvert_groupdict(match))
                 return True
 
         return False
 
+    def match_row(self, line: str) -> bool:
+        """Return whether the line is a table row, without converting its
+        values. This is used when progress rows are not collected."""
+        for regex in self.line_types:
+            if regex.match(line):
+                return True
+        return False
+
+    def parse_row(self, line: str):
+        """Tokenizer fast path for node log table rows.
+
+        The row type is identified from the new solution marker (H or *) and
+        the number of columns, and each column is converted directly.
+
+        Returns:
+            dict: The same entry as the matching regex in line_types would give,
+                or None if the line is not clearly a table row. In that case
+                the regexes decide.
+        """
+        tokens = line.split()
+        marker = line[:1]
+        if marker == "H" or marker == "*":
+            # The marker may be followed directly by the node count
+            if len(tokens[0]) > 1:
+                tokens[0] = tokens[0][1:]
+            else:
+                del tokens[0]
+            entry = {"NewSolution": marker}
+        elif marker.isspace():
+            marker = None
+            entry = {}
+        else:
+            return None
+        columns = self.row_columns[marker].get(len(tokens))
+        if columns is None:
+            return None
+        try:
+            for (name, convert), token in zip(columns, tokens):
+                entry[name] = convert(token)
+        except ValueError:
+            return None
+        return entry
+
     def get_progress(self) -> list:
         """Return the progress of the search tree."""
-        result = list(self._progress)
-        if "Runtime" in self._summary:
-            # Final statistics are added as a final tracked line.
-            result.append(
-                {
-                    "Incumbent": self._summary.get("ObjVal"),
-                    "BestBd": self._summary.get("ObjBound"),
-                    "Gap": self._summary.get("MIPGap"),
-                    "CurrentNode": self._summary.get("NodeCount"),
-                    "Time": self._summary.get("Runtime"),
-                }
-            )
+        return self.get_progress_table().to_records()
+
+    def get_progress_table(self) -> ProgressTable:
+        """Return the progress of the search tree in columnar form."""
+        if "Runtime" not in self._summary:
+            return self._progress
+        # Final statistics are added as a final tracked line.
+        result = self._progress.copy()
+        result.append(
+            {
+                "Incumbent": self._summary.get("ObjVal"),
+                "BestBd": self._summary.get("ObjBound"),
+                "Gap": self._summary.get("MIPGap"),
+                "CurrentNode": self._summary.get("NodeCount"),
+                "Time": self._summary.get("Runtime"),
+            }
+        )
         return result
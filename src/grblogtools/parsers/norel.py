@@ -1,5 +1,6 @@
 import re
 
+from grblogtools.parsers.progress import ProgressTable
 from grblogtools.parsers.util import typeconvert_groupdict
 
 
@@ -16,8 +17,22 @@ class NoRelParser:
         re.compile(r"Elapsed time for NoRel heuristic:\s(?P<Time>\d+)s"),
     ]
 
-    def __init__(self):
-        self._progress = []
+    # Line keys (see util.line_key) of all the above patterns
+    line_keys = frozenset({"Starting", "Found", "Elapsed"})
+
+    def __init__(self, progress_limit=None, collect=True):
+        """Initialize the NoRel parser.
+
+        Args:
+            progress_limit (int, optional): Only keep this many of the most
+                recent progress rows. Defaults to None, keeping all rows.
+            collect (bool, optional): Collect progress rows. Pass False to only
+                track the parser state. Defaults to True.
+        """
+        self._progress = ProgressTable(maxlen=progress_limit)
+        self._collect = collect
+        # The last progress entry, which is kept even if rows are not collected
+        self._last = None
         self._incumbent = None
         self._started = False
 
@@ -26,9 +41,9 @@ class NoRelParser:
 
         It assumes that the best bound is always found in the last line, if exists.
         """
-        if not self._progress:
+        if self._last is None:
             return {}
-        last_log = self._progress[-1]
+        last_log = self._last
         result = {"NoRelTime": last_log["Time"]}
         if "BestBd" in last_log:
             result["NoRelBestBd"] = last_log["BestBd"]
@@ -63,11 +78,17 @@ class NoRelParser:
                 entry = typeconvert_groupdict(match)
                 if self._incumbent is not None:
                     entry["Incumbent"] = self._incumbent
-                self._progress.append(entry)
+                self._last = entry
+                if self._collect:
+                    self._progress.append(entry)
                 return True
 
         return False
 
     def get_progress(self) -> list:
         """Return the progress of the norel heuristic."""
+        return self._progress.to_records()
+
+    def get_progress_table(self) -> ProgressTable:
+        """Return the progress of the norel heuristic in columnar form."""
         return self._progress
@@ -1,6 +1,10 @@
 import re
 
-from grblogtools.parsers.util import typeconvert_groupdict
+from grblogtools.parsers.util import (
+    CombinedPattern,
+    typeconvert_dict,
+    typeconvert_groupdict,
+)
 
 
 class PresolveParser:
@@ -63,9 +67,34 @@ class PresolveParser:
         re.compile(r"Presolve time: (?P<PresolveTime>[\d\.]+)s"),
     ]
 
+    # All intermediate patterns are matched with a single regex call
+    presolve_intermediate_regex = CombinedPattern(presolve_intermediate_patterns)
+
     # Special case: model solved by presolve
     presolve_all_removed = re.compile(r"Presolve: All rows and columns removed")
 
+    # Line keys (see util.line_key) of all the above patterns
+    line_keys = frozenset(
+        {
+            "Optimize",
+            "Model",
+            "Variable",
+            "Semi-Variable",
+            "QMatrix",
+            "QLMatrix",
+            "Matrix",
+            "QObjective",
+            "Objective",
+            "Bounds",
+            "RHS",
+            "QRHS",
+            "Distributed",
+            "Concurrent",
+            "Presolved",
+            "Presolve",
+        }
+    )
+
     def __init__(self):
         """Initialize the Presolve parser.
 
@@ -94,11 +123,10 @@ class PresolveParser:
                 return True
             return False
 
-        for pattern in PresolveParser.presolve_intermediate_patterns:
-            match = pattern.match(line)
-            if match:
-                self._summary.update(typeconvert_groupdict(match))
-                return True
+        match = PresolveParser.presolve_intermediate_regex.match(line)
+        if match:
+            self._summary.update(typeconvert_dict(match[1]))
+            return True
 
         match = PresolveParser.presolve_all_removed.match(line)
         if match:
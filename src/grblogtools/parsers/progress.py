@@ -0,0 +1,193 @@
+from array import array
+
+import numpy as np
+
+# Mask values recording the state of each cell in a column
+ABSENT = 0
+PRESENT = 1
+NONE = 2
+
+
+class ProgressTable:
+    """Append-only columnar storage for the rows of a progress table.
+
+    Rows are appended as dicts (as produced by typeconvert_groupdict) but are
+    stored column by column: integers in an array of int64, floats in an array
+    of float64 and anything else in a list. A mask per column records whether
+    each cell holds a value, an explicit None, or was absent from the row.
+
+    If maxlen is given, the table acts as a ring buffer keeping only the most
+    recent maxlen rows. Older rows are dropped in batches, so at most twice that
+    number of rows is held in memory.
+    """
+
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self._columns = {}
+        self._length = 0
+        # Number of dropped rows not yet removed from the columns
+        self._start = 0
+
+    def __len__(self):
+        return self._length - self._start
+
+    def __iter__(self):
+        self._compact()
+        for row in range(self._length):
+            yield self.row(row)
+
+    def append(self, entry: dict) -> None:
+        """Append a row. Columns not seen before are added on the fly."""
+        row = self._length
+        columns = self._columns
+        for name, value in entry.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [array("q"), bytearray()]
+            values, mask = column
+            if len(mask) < row:
+                pad_column(column, row)
+            if value is None:
+                mask.append(NONE)
+                values.append(0 if type(values) is array else None)
+                continue
+            try:
+                values.append(value)
+            except (TypeError, OverflowError):
+                column[0] = values = upgrade_values(values, value)
+                values.append(value)
+            mask.append(PRESENT)
+        self._length = row + 1
+        if self.maxlen is not None and self._length - self._start > self.maxlen:
+            self._start += 1
+            if self._start >= self.maxlen:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Remove the dropped rows from the columns."""
+        start = self._start
+        if not start:
+            return
+        for column in self._columns.values():
+            pad_column(column, self._length)
+            values, mask = column
+            del values[:start]
+            del mask[:start]
+        self._length -= start
+        self._start = 0
+
+    def extend(self, table: "ProgressTable") -> None:
+        """Append all rows of another table."""
+        for entry in table:
+            self.append(entry)
+
+    def copy(self) -> "ProgressTable":
+        """Return a copy of this table which can be appended to separately. The
+        copy has no row limit."""
+        self._compact()
+        table = ProgressTable()
+        table._columns = {
+            name: [values[:], mask[:]] for name, (values, mask) in self._columns.items()
+        }
+        table._length = self._length
+        return table
+
+    def row(self, index: int) -> dict:
+        """Return the row at the given index as a dict. Cells absent from the
+        appended row are left out."""
+        if index < 0:
+            index += len(self)
+        index += self._start
+        entry = {}
+        for name, (values, mask) in self._columns.items():
+            state = mask[index] if index < len(mask) else ABSENT
+            if state == PRESENT:
+                entry[name] = values[index]
+            elif state == NONE:
+                entry[name] = None
+        return entry
+
+    def last(self) -> dict:
+        """Return the last row as a dict."""
+        return self.row(-1)
+
+    def to_records(self) -> list:
+        """Return all rows as a list of dicts."""
+        return list(self)
+
+    def to_columns(self) -> dict:
+        """Return a dict of numpy arrays, one per column, from which a pandas
+        DataFrame can be built without going through the rows.
+
+        The result matches the dtypes pandas infers from the list of rows:
+        integer columns with missing values become floats with NaN, and
+        object columns hold NaN for absent cells and None for explicit Nones.
+        """
+        self._compact()
+        result = {}
+        for name, column in self._columns.items():
+            pad_column(column, self._length)
+            values, mask = column
+            mask = np.frombuffer(bytes(mask), dtype=np.uint8)
+            if not mask.any():
+                # Only rows dropped from a ring buffer had this column
+                continue
+            if type(values) is array and (mask == PRESENT).any():
+                data = np.array(values)
+                missing = mask != PRESENT
+                if missing.any():
+                    data = data.astype(np.float64)
+                    data[missing] = np.nan
+            else:
+                data = np.empty(self._length, dtype=object)
+                data[:] = values if type(values) is list else None
+                data[mask == NONE] = None
+                data[mask == ABSENT] = np.nan
+            result[name] = data
+        return result
+
+    def dtypes(self, unknown=np.dtype(object)) -> dict:
+        """Return the dtypes of the arrays returned by to_columns, without
+        building them.
+
+        Args:
+            unknown (optional): Dtype reported for columns holding only None.
+                Defaults to object, as in to_columns.
+        """
+        result = {}
+        for name, column in self._columns.items():
+            pad_column(column, self._length)
+            values, mask = column
+            mask = mask[self._start :]
+            if not mask.strip(bytes(1)):
+                continue
+            if type(values) is array and PRESENT in mask:
+                if mask.count(PRESENT) < len(mask) or values.typecode == "d":
+                    result[name] = np.dtype(np.float64)
+                else:
+                    result[name] = np.dtype(np.int64)
+            elif PRESENT in mask:
+                result[name] = np.dtype(object)
+            else:
+                result[name] = unknown
+        return result
+
+
+def pad_column(column, length):
+    """Fill the column with absent cells up to the given length."""
+    values, mask = column
+    missing = length - len(mask)
+    if missing > 0:
+        mask.extend(bytes(missing))
+        if type(values) is array:
+            values.frombytes(bytes(missing * values.itemsize))
+        else:
+            values.extend([None] * missing)
+
+
+def upgrade_values(values, value):
+    """Return the column values in a container which can also hold the given
+    value: int64 arrays move to float64 for floats, and to lists otherwise."""
+    if values.typecode == "q" and type(value) is float:
+        return array("d", values)
+    return values.tolist()
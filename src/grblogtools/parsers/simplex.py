@@ -1,6 +1,7 @@
 import re
 
-from grblogtools.parsers.util import float_pattern, typeconvert_groupdict
+from grblogtools.parsers.progress import ProgressTable
+from grblogtools.parsers.util import NUMBER_KEY, float_pattern, typeconvert_groupdict
 
 
 class SimplexParser:
@@ -26,10 +27,21 @@ class SimplexParser:
         ),
     ]
 
-    def __init__(self):
-        """Initialize the Simplex parser."""
+    # Line keys (see util.line_key) of all the above patterns
+    line_keys = frozenset({"Iteration", NUMBER_KEY, "Solved", "Stopped"})
+
+    def __init__(self, progress_limit=None, collect=True):
+        """Initialize the Simplex parser.
+
+        Args:
+            progress_limit (int, optional): Only keep this many of the most
+                recent progress rows. Defaults to None, keeping all rows.
+            collect (bool, optional): Collect progress rows. Pass False to only
+                track the parser state. Defaults to True.
+        """
         self._summary = {}
-        self._progress = []
+        self._progress = ProgressTable(maxlen=progress_limit)
+        self._collect = collect
         self._started = False
 
     def parse(self, line: str) -> bool:
@@ -60,6 +72,8 @@ class SimplexParser:
 
         progress_match = SimplexParser.simplex_progress_pattern.match(line)
         if progress_match:
+            if not self._collect:
+                return True
             entry = {"Type": "simplex"}
             entry.update(typeconvert_groupdict(progress_match))
             self._progress.append(entry)
@@ -73,4 +87,8 @@ class SimplexParser:
 
     def get_progress(self) -> list:
         """Return the detailed progress in simplex method if exists."""
+        return self._progress.to_records()
+
+    def get_progress_table(self) -> ProgressTable:
+        """Return the detailed progress in simplex method in columnar form."""
         return self._progress
@@ -4,7 +4,18 @@ from grblogtools.parsers.nodelog import NodeLogParser
 from grblogtools.parsers.norel import NoRelParser
 from grblogtools.parsers.presolve import PresolveParser
 from grblogtools.parsers.termination import TerminationParser
-from grblogtools.parsers.util import model_type
+from grblogtools.parsers.util import line_key, model_type
+
+# Sections with a progress table, see ParseResult.progress
+PROGRESS_SECTIONS = frozenset({"norel", "rootlp", "nodelog"})
+
+
+def parse_dispatched(parser, key, line: str) -> bool:
+    """Parse the line only if the parser has a pattern for the line key."""
+    keys = parser.line_keys
+    if keys is not None and key not in keys:
+        return False
+    return parser.parse(line)
 
 
 class SingleLogParser:
@@ -13,13 +24,27 @@ class SingleLogParser:
     It expects parse to be called once for each line in a log file.
     """
 
-    def __init__(self):
+    def __init__(self, progress_limit=None, progress_sections=PROGRESS_SECTIONS):
+        """Initialize the sub-parsers.
+
+        Args:
+            progress_limit (int, optional): Only keep this many of the most
+                recent rows of each progress table. Defaults to None, keeping
+                all rows.
+            progress_sections (set, optional): Sections whose progress rows are
+                collected. Other sections only track the parser state and the
+                summary data. Defaults to all sections.
+        """
+        self.progress_sections = frozenset(progress_sections)
+
+        sections = self.progress_sections
+
         # Parsers in sequence
         self.header_parser = HeaderParser()
         self.presolve_parser = PresolveParser()
-        self.norel_parser = NoRelParser()
-        self.continuous_parser = ContinuousParser()
-        self.nodelog_parser = NodeLogParser()
+        self.norel_parser = NoRelParser(progress_limit, "norel" in sections)
+        self.continuous_parser = ContinuousParser(progress_limit, "rootlp" in sections)
+        self.nodelog_parser = NodeLogParser(progress_limit, "nodelog" in sections)
         self.termination_parser = TerminationParser()
 
         # State
@@ -51,6 +76,15 @@ class SingleLogParser:
         )
         return summary
 
+    def get_progress_table(self, section: str):
+        """Return the progress table of the given section, one of
+        PROGRESS_SECTIONS."""
+        if section == "nodelog":
+            return self.nodelog_parser.get_progress_table()
+        if section == "rootlp":
+            return self.continuous_parser.get_progress_table()
+        return self.norel_parser.get_progress_table()
+
     def parse(self, line: str) -> bool:
         """Parse the given log line to populate the component parsers in sequence.
 
@@ -60,28 +94,33 @@ class SingleLogParser:
         Returns:
             bool: Return True if the given line is matched by some pattern.
         """
+        # Lines are only passed to the parsers declaring a pattern for their key
+        key = line_key(line)
+        if key is None:
+            return False
+
         # Initially, only check the header parser until started
         if not self.started:
             assert self.current_parser is self.header_parser
-            matched = self.current_parser.parse(line)
+            matched = parse_dispatched(self.current_parser, key, line)
             if matched:
                 self.started = True
             return matched
 
         # First try the current parser
         assert self.current_parser not in self.future_parsers
-        if self.current_parser.parse(line):
+        if parse_dispatched(self.current_parser, key, line):
             return True
 
         # Check if any future parsers should take over
         for i, parser in enumerate(self.future_parsers):
-            if parser.parse(line):
+            if parse_dispatched(parser, key, line):
                 self.current_parser = parser
                 self.future_parsers = self.future_parsers[i + 1 :]
                 return True
 
         # Check if the line matches any pattern of the termination parser
-        if self.termination_parser.parse(line):
+        if parse_dispatched(self.termination_parser, key, line):
             return True
 
         # Nothing matched
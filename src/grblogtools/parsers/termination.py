@@ -1,6 +1,6 @@
 import re
 
-from grblogtools.parsers.util import typeconvert_groupdict
+from grblogtools.parsers.util import CombinedPattern, typeconvert_dict
 
 
 class TerminationParser:
@@ -33,6 +33,32 @@ class TerminationParser:
         ),
     ]
 
+    # All patterns are matched with a single regex call
+    regex = CombinedPattern(patterns)
+
+    # Line keys (see util.line_key) of all the above patterns
+    line_keys = frozenset(
+        {
+            "ERROR",
+            "[process",
+            "Time",
+            "Optimal",
+            "Iteration",
+            "Infeasible",
+            "Model",
+            "Unbounded",
+            "Solution",
+            "Node",
+            "Numeric",
+            "Numerical",
+            "Objective",
+            "Optimization",
+            "Interrupt",
+            "Solve",
+            "Thread",
+        }
+    )
+
     status = [
         "OPTIMAL",
         "TIME_LIMIT",
@@ -59,15 +85,14 @@ class TerminationParser:
         Returns:
             bool: Return True if the given line is matched by some pattern.
         """
-        for pattern in TerminationParser.patterns:
-            match = pattern.match(line)
-            if match:
-                for key, value in typeconvert_groupdict(match).items():
-                    if key in TerminationParser.status:
-                        self._summary.update({"Status": key})
-                    else:
-                        self._summary.update({key: value})
-                return True
+        match = TerminationParser.regex.match(line)
+        if match:
+            for key, value in typeconvert_dict(match[1]).items():
+                if key in TerminationParser.status:
+                    self._summary.update({"Status": key})
+                else:
+                    self._summary.update({key: value})
+            return True
         return False
 
     def get_summary(self) -> dict:
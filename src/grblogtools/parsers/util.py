@@ -9,6 +9,33 @@ float_regex = re.compile(r"[-+]?((\d*\.\d+)|(\d+\.?))([Ee][+-]?\d+)?$")
 percentage_regex = re.compile(r"[-+]?((\d*\.\d+)|(\d+\.?))([Ee][+-]?\d+)?%$")
 date_time_regex = re.compile(r"\D+\s\D+\s\d+\s\d+:\d+:\d+\s\d{4}")
 
+# Dispatch key shared by all lines starting with a digit (table rows)
+NUMBER_KEY = "#"
+
+
+def line_key(line: str):
+    """Return a cheap key identifying which patterns could match the given line.
+
+    The key is the first token of the line with any trailing colon removed.
+    Lines starting with a digit share NUMBER_KEY, and node log lines flagged
+    with a new solution marker are keyed by the marker (H or *). Blank lines
+    have no key and are never matched by any parser.
+
+    Parsers declare the keys of the lines they can match in a line_keys
+    attribute (None meaning any line) so that the SingleLogParser only passes
+    a line to the parsers that could possibly match it.
+    """
+    tokens = line.split(None, 1)
+    if not tokens:
+        return None
+    token = tokens[0]
+    first = token[0]
+    if first.isdigit():
+        return NUMBER_KEY
+    if first in "H*" and (len(token) == 1 or token[1].isdigit()):
+        return first
+    return token.rstrip(":")
+
 
 def convert_data_types(value):
     """Convert the given value string to the type it matches."""
@@ -27,9 +54,195 @@ def convert_data_types(value):
         return value
 
 
+def convert_percentage(value):
+    """Convert a percentage string to a fraction."""
+    return float(value.rstrip("%")) / 100
+
+
+def fields(converter, *names):
+    return dict.fromkeys(names, converter)
+
+
+# Known types of the named groups in the parser patterns. Values of these groups
+# are converted directly, and only values of other groups go through the regex
+# cascade in convert_data_types. Note that the Time group holds seconds in
+# progress tables, but a date in the header: values which fail the declared
+# conversion also fall back to the cascade.
+field_types = {
+    **fields(
+        int,
+        # Header, presolve and termination
+        "PhysicalCores",
+        "LogicalProcessors",
+        "Threads",
+        "Cores",
+        "Rows",
+        "Columns",
+        "Nonzeros",
+        "NumConstrs",
+        "NumVars",
+        "NumNZs",
+        "NumQNZs",
+        "NumQConstrs",
+        "NumSOS",
+        "NumPWLObjVars",
+        "NumGenConstrs",
+        "DistributedMIPJobs",
+        "ConcurrentJobs",
+        "PresolvedNumConstrs",
+        "PresolvedNumVars",
+        "PresolvedNumNZs",
+        "PresolvedNumConVars",
+        "PresolvedNumIntVars",
+        "PresolvedNumBinVars",
+        "PresolvedNumSemiContVars",
+        "PresolvedNumSemiIntVars",
+        "PresolvedNumSOS",
+        "PresolvedNumQNZs",
+        "SolCount",
+        # Continuous and node log
+        "RelaxIterCount",
+        "BarIterCount",
+        "IterCount",
+        "NodeCount",
+        "Iteration",
+        "CurrentNode",
+        "RemainingNodes",
+        "Depth",
+        "IntInf",
+        "PushPhaseEndTime",
+        "Time",
+    ),
+    **fields(
+        float,
+        # Header and presolve
+        "ReadingTime",
+        "PresolveTime",
+        "MinCoeff",
+        "MaxCoeff",
+        "MinQCCoeff",
+        "MaxQCCoeff",
+        "MinQCLCoeff",
+        "MaxQCLCoeff",
+        "MinObjCoeff",
+        "MaxObjCoeff",
+        "MinQObjCoeff",
+        "MaxQObjCoeff",
+        "MinBound",
+        "MaxBound",
+        "MinRHS",
+        "MaxRHS",
+        "MinQCRHS",
+        "MaxQCRHS",
+        # Continuous and node log
+        "RelaxObj",
+        "RelaxTime",
+        "OrderingTime",
+        "PObj",
+        "DObj",
+        "PRes",
+        "DRes",
+        "Compl",
+        "PushPhasePInf",
+        "PushPhaseDInf",
+        "Objective",
+        "PInf",
+        "DInf",
+        "Obj",
+        "Incumbent",
+        "BestBd",
+        "ItPerNode",
+        "ObjVal",
+        "ObjBound",
+        "Runtime",
+        "Work",
+    ),
+    **fields(convert_percentage, "Gap", "MIPGap"),
+    **fields(
+        str,
+        "Version",
+        "Platform",
+        "JobID",
+        "ModelFilePath",
+        "ModelName",
+        "Fingerprint",
+        "Indicator",
+        "Pruned",
+        "NewSolution",
+        "ErrorMessage",
+    ),
+}
+
+
+def convert_field(name, value):
+    """Convert the value captured by the named group to its declared type."""
+    if value is None or value == "-":
+        return None
+    converter = field_types.get(name)
+    if converter is not None:
+        try:
+            return converter(value)
+        except ValueError:
+            pass
+    return convert_data_types(value)
+
+
 def typeconvert_groupdict(match: re.Match):
     """Return the groupdict of a regex match with type converted values."""
-    return {k: convert_data_types(v) for k, v in match.groupdict().items()}
+    return typeconvert_dict(match.groupdict())
+
+
+def typeconvert_dict(groups: dict):
+    """Return a copy of the given dict of captured groups with type converted
+    values."""
+    return {k: convert_field(k, v) for k, v in groups.items()}
+
+
+group_name_regex = re.compile(r"\(\?P<(\w+)>")
+
+
+class CombinedPattern:
+    """A list of patterns matched with a single alternation regex.
+
+    The named groups of each pattern are renamed so that they are unique in
+    the combined regex, and each pattern is wrapped in a named group so that
+    the branch that fired can be read from match.lastgroup. Branches are tried
+    in list order, so the result is the same as matching the patterns one by
+    one and stopping at the first match. The combined regex is compiled on the
+    first match, so that importing the parsers stays cheap.
+    """
+
+    def __init__(self, patterns):
+        branches = []
+        self._branches = {}
+        for index, pattern in enumerate(patterns):
+            prefix = f"_{index}"
+            source = group_name_regex.sub(
+                lambda m: f"(?P<{prefix}_{m.group(1)}>", pattern.pattern
+            )
+            branches.append(f"(?P<{prefix}>{source})")
+            names = sorted(pattern.groupindex, key=pattern.groupindex.get)
+            self._branches[prefix] = (
+                index,
+                [(f"{prefix}_{name}", name) for name in names],
+            )
+        self.pattern = "|".join(branches)
+        self._regex = None
+
+    def match(self, line: str):
+        """Match the line against all patterns at once.
+
+        Returns:
+            tuple: The index of the matching pattern and its groupdict, or None
+                if no pattern matches.
+        """
+        if self._regex is None:
+            self._regex = re.compile(self.pattern)
+        match = self._regex.match(line)
+        if not match:
+            return None
+        index, groups = self._branches[match.lastgroup]
+        return index, {name: match.group(group) for group, name in groups}
 
 
 def parse_lines(parser, loglines: Iterable[str]):
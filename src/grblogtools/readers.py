@@ -0,0 +1,270 @@
+"""Line readers used to feed log files to the parsers.
+
+Each reader takes the path of a log file and yields its lines as str, ending
+with a newline (except possibly the last line), as iterating over a file opened
+in text mode would. read_line_batches_async is the asynchronous counterpart,
+yielding the lines of each chunk read by an executor.
+"""
+
+import asyncio
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import os
+import queue
+import threading
+
+# Openers of compressed files by their leading magic bytes
+compression_formats = {
+    b"\x1f\x8b": gzip.open,
+    b"BZh": bz2.open,
+    b"\xfd7zXZ\x00": lzma.open,
+}
+
+# Suffixes of compressed log files also matched by log file glob patterns
+compression_suffixes = (".gz", ".bz2", ".xz")
+
+
+def compression_opener(logfile: str):
+    """Return the function opening the log file if it is compressed, detected
+    from its magic bytes, or None if it is not compressed."""
+    with open(logfile, "rb") as infile:
+        magic = infile.read(6)
+    for prefix, opener in compression_formats.items():
+        if magic.startswith(prefix):
+            return opener
+    return None
+
+
+def read_lines(logfile: str):
+    """Read the log file in text mode.
+
+    Compressed files are decompressed on the fly by a background thread, so
+    that decompression overlaps with parsing. As for uncompressed files, bytes
+    which are not valid UTF-8 raise a UnicodeDecodeError.
+    """
+    opener = compression_opener(logfile)
+    if opener is not None:
+        chunks = read_chunks_background(opener(logfile, "rb"))
+        yield from split_lines(chunks, errors="strict")
+        return
+    with open(logfile, encoding="utf-8") as infile:
+        yield from infile
+
+
+def read_lines_mmap(logfile: str, chunk_size: int = 1 << 24):
+    """Read the log file through a memory map.
+
+    The file is decoded in large chunks ending on a line boundary rather than
+    line by line, and stray bytes which are not valid UTF-8 are replaced rather
+    than raising an error.
+    """
+    opener = compression_opener(logfile)
+    if opener is not None:
+        # Compressed files cannot be mapped, decompress them as a stream
+        yield from split_lines(read_chunks_background(opener(logfile, "rb")))
+        return
+    yield from read_lines_range(logfile, errors="replace", chunk_size=chunk_size)
+
+
+def read_lines_range(
+    logfile: str,
+    start: int = 0,
+    end: int = None,
+    errors: str = "strict",
+    chunk_size: int = 1 << 24,
+):
+    """Read the lines within a byte range of an uncompressed log file through a
+    memory map. The range should start and end on a line boundary.
+
+    Args:
+        logfile (str): Path of the log file.
+        start (int, optional): Offset of the first byte. Defaults to 0.
+        end (int, optional): Offset after the last byte. Defaults to None,
+            reading to the end of the file.
+        errors (str, optional): How bytes which are not valid UTF-8 are
+            handled, as in bytes.decode. Defaults to strict.
+        chunk_size (int, optional): Approximate number of bytes decoded at once.
+    """
+    with open(logfile, "rb") as infile:
+        size = os.fstat(infile.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            while start < end:
+                stop = data.rfind(b"\n", start, min(start + chunk_size, end)) + 1
+                if stop <= start:
+                    # No line ends within the chunk; extend it to the next one
+                    stop = data.find(b"\n", start + chunk_size, end) + 1 or end
+                text = data[start:stop].decode(errors=errors)
+                # Translate newlines as in text mode and split in C
+                yield from io.StringIO(text, newline=None)
+                start = stop
+
+
+def read_lines_pipelined(logfile: str, chunk_size: int = 1 << 20, queue_size: int = 8):
+    """Read the log file in a background thread, which reads, decompresses and
+    splits chunks of the file into lists of lines up to queue_size chunks
+    ahead of the parser.
+
+    Waiting for the storage then overlaps with parsing, which helps for single
+    large files where a process pool does not. As in split_lines, bytes which
+    are not valid UTF-8 are replaced.
+    """
+    opener = compression_opener(logfile) or open
+    batches = split_line_batches(read_chunks(opener(logfile, "rb"), chunk_size))
+    for lines in iterate_background(batches, queue_size):
+        yield from lines
+
+
+def read_chunks(fileobj, chunk_size: int = 1 << 20):
+    """Yield chunks of bytes read from the binary file object, which is closed
+    once it has been read."""
+    with fileobj:
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def read_chunks_background(fileobj, chunk_size: int = 1 << 20, queue_size: int = 8):
+    """Yield chunks of bytes read from the binary file object by a background
+    thread, which reads ahead by up to queue_size chunks. The file object is
+    closed once it has been read."""
+    return iterate_background(read_chunks(fileobj, chunk_size), queue_size)
+
+
+def iterate_background(items, queue_size: int = 8):
+    """Yield the items of an iterator advanced by a background thread, which
+    runs ahead by up to queue_size items. The iterator is closed once the
+    consumer stops."""
+    results = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        # Give up if the consumer stops early rather than blocking forever
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(done)
+        except Exception as error:
+            put(error)
+        finally:
+            if hasattr(items, "close"):
+                items.close()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = results.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def split_lines(chunks, errors: str = "replace"):
+    """Split chunks of bytes into lines of text. Each chunk is decoded up to
+    its last line end at once, by default replacing bytes which are not valid
+    UTF-8. Other ways to handle them are given by errors, as in bytes.decode.
+    """
+    partial = b""
+    for chunk in chunks:
+        lines, partial = split_chunk(partial, chunk, errors)
+        yield from lines
+    if partial:
+        yield from decode_lines(partial, errors)
+
+
+def split_line_batches(chunks):
+    """Yield the lines split from each chunk of bytes as a list, as split_lines
+    does."""
+    partial = b""
+    for chunk in chunks:
+        lines, partial = split_chunk(partial, chunk)
+        if lines:
+            yield list(lines)
+    if partial:
+        yield list(decode_lines(partial))
+
+
+def split_chunk(partial: bytes, chunk: bytes, errors: str = "replace"):
+    """Return the lines completed by the chunk following the partial line, and
+    the new partial line after the last line end."""
+    end = chunk.rfind(b"\n") + 1
+    if not end:
+        return (), partial + chunk
+    return decode_lines(partial + chunk[:end], errors), chunk[end:]
+
+
+def decode_lines(data: bytes, errors: str = "replace"):
+    """Return an iterator over the lines of the bytes decoded as text."""
+    # Translate newlines as in text mode and split in C
+    return io.StringIO(data.decode(errors=errors), newline=None)
+
+
+async def read_line_batches_async(
+    logfile: str, executor=None, chunk_size: int = 1 << 20
+):
+    """Yield the lines of the log file in batches, one for each chunk of bytes.
+
+    Opening the file and reading each chunk run in the executor, so that the
+    event loop can parse other files while waiting for slow storage. Compressed
+    files are decompressed by the executor too. As in split_lines, bytes which
+    are not valid UTF-8 are replaced.
+
+    Args:
+        logfile (str): Path of the log file.
+        executor (optional): Executor doing the blocking calls. Defaults to
+            None, using the default executor of the event loop.
+        chunk_size (int, optional): Number of bytes read at once.
+    """
+    loop = asyncio.get_running_loop()
+    opener = await loop.run_in_executor(executor, compression_opener, logfile)
+    fileobj = await loop.run_in_executor(executor, opener or open, logfile, "rb")
+    try:
+        partial = b""
+        while True:
+            chunk = await loop.run_in_executor(executor, fileobj.read, chunk_size)
+            if not chunk:
+                break
+            lines, partial = split_chunk(partial, chunk)
+            yield lines
+        if partial:
+            yield decode_lines(partial)
+    finally:
+        await loop.run_in_executor(executor, fileobj.close)
+
+
+readers = {
+    "text": read_lines,
+    "mmap": read_lines_mmap,
+    "pipelined": read_lines_pipelined,
+}
+
+# How each reader handles bytes which are not valid UTF-8
+reader_errors = {
+    "text": "strict",
+    "mmap": "replace",
+    "pipelined": "replace",
+}
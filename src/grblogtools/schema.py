@@ -0,0 +1,167 @@
+"""Declared dtypes of the summary columns, and a columnar builder for them.
+
+Summary rows are written into pre-allocated per-column lists, and each list is
+converted once to an array of the declared dtype of its column. Columns without
+a declared dtype are left to the same inference pandas applies to a list of
+rows. The arrays of rows added later are concatenated onto the converted ones.
+
+Frames can also be compacted, storing each column in the narrowest dtype which
+holds its values within the precision documented in compact_frame.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from grblogtools.parsers.util import convert_percentage, field_types
+
+# Declared dtype of each summary field, based on the types of the parsed fields
+summary_types = {
+    **{
+        name: "int64" if converter is int else "float64"
+        for name, converter in field_types.items()
+        if converter in (int, float, convert_percentage)
+    },
+    **dict.fromkeys(["NoRelTime", "NoRelBestBd", "NoRelBestSol"], "float64"),
+    **dict.fromkeys(["Status", "ModelType", "Platform"], "category"),
+    **dict.fromkeys(
+        ["Version", "ModelFilePath", "ModelName", "Fingerprint", "LogFilePath"],
+        "object",
+    ),
+    "LogNumber": "int64",
+    # The header Time is a date, unlike the Time column of progress tables
+    "Time": "datetime64[ns]",
+}
+
+# Text columns with at most this fraction of distinct values are stored as
+# categoricals in compact frames
+CATEGORY_RATIO = 0.5
+
+
+def summary_type(name: str):
+    """Return the declared dtype of the summary column, or None."""
+    if name.startswith("Cuts: "):
+        return "int64"
+    return summary_types.get(name)
+
+
+def append_rows(columns: dict, length: int, rows) -> int:
+    """Write the rows into the lists of the columns dict, after the first
+    length rows. Cells absent from a row hold NaN.
+
+    Returns:
+        int: The number of rows in the columns.
+    """
+    rows = list(rows)
+    total = length + len(rows)
+    for values in columns.values():
+        values.extend([np.nan] * len(rows))
+    for position, entry in enumerate(rows, length):
+        for name, value in entry.items():
+            values = columns.get(name)
+            if values is None:
+                values = columns[name] = [np.nan] * total
+            values[position] = value
+    return total
+
+
+def convert_column(name: str, values: list):
+    """Return the values as an array of the declared dtype of the column.
+
+    Integer columns with missing values become floats with NaN. Columns whose
+    values fail their declared conversion, or without a declared dtype, are
+    left to pandas.
+    """
+    dtype = summary_type(name)
+    if dtype == "object":
+        data = np.empty(len(values), dtype=object)
+        data[:] = values
+        return data
+    if dtype == "category":
+        return pd.Categorical(values)
+    try:
+        if dtype == "int64":
+            data = np.array(values)
+            if data.dtype.kind == "i":
+                return data.astype(np.int64, copy=False)
+            return np.array(values, dtype=np.float64)
+        if dtype == "float64":
+            return np.array(values, dtype=np.float64)
+        if dtype == "datetime64[ns]":
+            data = np.empty(len(values), dtype=object)
+            data[:] = values
+            return pd.to_datetime(data).to_numpy()
+    except (TypeError, ValueError, OverflowError):
+        pass
+    return pd.Series(values).to_numpy()
+
+
+def summary_columns(columns: dict) -> dict:
+    """Return the columns filled by append_rows as arrays of their declared
+    dtypes."""
+    return {name: convert_column(name, values) for name, values in columns.items()}
+
+
+def concat_columns(columns: dict, length: int, added: dict, added_length: int):
+    """Return the arrays of summary_columns followed by the added arrays.
+
+    Columns absent from either part hold missing values there, so that the
+    dtypes are those of converting all rows at once.
+    """
+    if not length:
+        return added
+    result = {}
+    for name in {**columns, **added}:
+        head = columns.get(name)
+        if head is None:
+            head = convert_column(name, [np.nan] * length)
+        tail = added.get(name)
+        if tail is None:
+            tail = convert_column(name, [np.nan] * added_length)
+        if isinstance(head, pd.Categorical):
+            result[name] = union_categoricals([head, tail], sort_categories=True)
+            continue
+        kinds = {head.dtype.kind, tail.dtype.kind}
+        if head.dtype == tail.dtype or kinds == {"i", "f"}:
+            result[name] = np.concatenate([head, tail])
+        else:
+            # Mixed inferred dtypes, infer again as for a single conversion
+            result[name] = pd.Series([*head, *tail]).to_numpy()
+    return result
+
+
+def compact_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Return the frame with each column in the narrowest dtype holding its
+    values.
+
+    - Integer columns get the narrowest integer type holding all their values,
+      without any loss.
+    - Float columns are stored as float32. Each value changes by a relative
+      error of at most 2**-24 (about 6e-8), so the first seven significant
+      digits are kept. Columns with values outside the normal float32 range
+      (magnitudes from 1.2e-38 to 3.4e38, besides 0, NaN and infinities) stay
+      float64, and so do columns of whole numbers, such as node counts with
+      missing values, unless float32 holds them exactly (up to 2**24).
+    - Text columns with few distinct values become categoricals. None and NaN
+      are both stored as missing values.
+    """
+    columns = {}
+    for name, data in frame.items():
+        kind = data.dtype.kind
+        if kind in "iu":
+            data = pd.to_numeric(data, downcast="integer")
+        elif kind == "f" and data.dtype != np.float32:
+            values = np.abs(data.to_numpy())
+            values = values[np.isfinite(values) & (values != 0)]
+            limits = np.finfo(np.float32)
+            if values.size == 0:
+                data = data.astype(np.float32)
+            elif (values == np.round(values)).all():
+                if values.max() <= 1 << 24:
+                    data = data.astype(np.float32)
+            elif values.min() >= limits.tiny and values.max() <= limits.max:
+                data = data.astype(np.float32)
+        elif kind == "O" and data.nunique() <= CATEGORY_RATIO * len(data):
+            data = data.astype("category")
+        columns[name] = data
+    return pd.DataFrame(columns, index=frame.index)
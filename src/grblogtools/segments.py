@@ -0,0 +1,240 @@
+"""Splitting log files containing several run logs into separately parsed
+segments.
+
+A pre-scan finds the byte offsets of lines which start a new run log: the first
+parameter change or header start line after a run log started optimizing.
+Adjacent run logs are grouped into segments of a minimum size, and each segment
+is parsed on its own, possibly in a worker process. The run logs found by the
+pre-scan can be saved to a sidecar index next to the log file, which is then
+used instead of scanning the file again.
+
+The pre-scan only looks at line prefixes, so stitching the segments back
+together checks that the last run log of each segment indeed rejects the first
+line of the next segment, as it would in a sequential parse. If it does not, the
+file has to be parsed sequentially instead.
+"""
+
+import json
+import mmap
+import os
+import re
+
+from grblogtools.parsers.multi_log import MultiLogParser
+from grblogtools.parsers.single_log import PROGRESS_SECTIONS, SingleLogParser
+from grblogtools.readers import (
+    compression_opener,
+    read_lines_range,
+    reader_errors,
+    readers,
+)
+
+# Lines starting a new run log or one of its sections. A new run log only starts
+# after the previous one reached the presolve section.
+section_regex = re.compile(
+    rb"^(?:(?P<presolve>Optimize a model )|(?P<norel>Starting NoRel heuristic)"
+    rb"|(?P<nodelog> Expl Unexpl)"
+    rb"|(?P<start>Set parameter |Gurobi |Logging started |Compute Server job ID: ))",
+    re.MULTILINE,
+)
+
+# Sections whose starting offset is recorded for each run log
+RUN_SECTIONS = ("presolve", "norel", "nodelog")
+
+MIN_SEGMENT_SIZE = 1 << 22
+
+# Version and file name suffix of the sidecar index
+INDEX_FORMAT = 1
+INDEX_SUFFIX = ".glt.json"
+
+
+def find_runs(logfile: str) -> list:
+    """Pre-scan an uncompressed log file for its run logs.
+
+    Returns:
+        list: A dict for each run log, with the byte offsets of its start and
+            end, and of the start of each section in RUN_SECTIONS it contains.
+    """
+    size = os.path.getsize(logfile)
+    runs = [{"start": 0}]
+    if size == 0:
+        runs[0]["end"] = 0
+        return runs
+    optimizing = False
+    with open(logfile, "rb") as infile:
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for match in section_regex.finditer(data):
+                section = match.lastgroup
+                if section == "start":
+                    if optimizing:
+                        optimizing = False
+                        runs[-1]["end"] = match.start()
+                        runs.append({"start": match.start()})
+                    continue
+                if section == "presolve":
+                    optimizing = True
+                runs[-1].setdefault(section, match.start())
+    runs[-1]["end"] = size
+    return runs
+
+
+def index_path(logfile: str) -> str:
+    """Return the path of the sidecar index of the log file."""
+    return logfile + INDEX_SUFFIX
+
+
+def write_index(logfile: str, runs: list) -> None:
+    """Write the run logs found by find_runs to the sidecar index, stamped with
+    the size and modification time of the log file."""
+    stat = os.stat(logfile)
+    index = {
+        "format": INDEX_FORMAT,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "runs": runs,
+    }
+    with open(index_path(logfile), "w") as outfile:
+        json.dump(index, outfile)
+
+
+def read_index(logfile: str):
+    """Return the run logs recorded in the sidecar index of the log file, or
+    None if there is no index or the file changed since it was written."""
+    try:
+        with open(index_path(logfile)) as infile:
+            index = json.load(infile)
+        stat = os.stat(logfile)
+    except (OSError, ValueError):
+        return None
+    if (
+        index.get("format") != INDEX_FORMAT
+        or index.get("size") != stat.st_size
+        or index.get("mtime_ns") != stat.st_mtime_ns
+    ):
+        return None
+    return index["runs"]
+
+
+def find_segments(logfile: str, min_size: int = None) -> list:
+    """Return the (start, end) byte ranges of the segments of the log file.
+
+    Segments start at a run log boundary and, except the last one, are at least
+    min_size bytes long. Compressed and small files are a single segment with
+    range (0, None). Run log boundaries are taken from the sidecar index if it
+    is up to date.
+
+    Args:
+        logfile (str): Path of the log file.
+        min_size (int, optional): Minimum segment size in bytes. Defaults to
+            MIN_SEGMENT_SIZE.
+    """
+    if min_size is None:
+        min_size = MIN_SEGMENT_SIZE
+    size = os.path.getsize(logfile)
+    if size < 2 * min_size or compression_opener(logfile) is not None:
+        return [(0, None)]
+
+    runs = read_index(logfile) or find_runs(logfile)
+    starts = [0]
+    for run in runs[1:]:
+        offset = run["start"]
+        if offset - starts[-1] >= min_size and size - offset >= min_size:
+            starts.append(offset)
+
+    if len(starts) == 1:
+        return [(0, None)]
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def scan_logfile(logfile: str, reader: str = "text", index: bool = False) -> list:
+    """Parse the header of each run log in the log file, stopping once the
+    presolve output begins.
+
+    Run logs are found by the pre-scan, or taken from the sidecar index if it
+    is up to date. Compressed files cannot be scanned by byte offsets and are
+    parsed completely, without progress rows.
+
+    Args:
+        logfile (str): Path of the log file.
+        reader (str, optional): Reader used for the file. Defaults to text.
+        index (bool, optional): Write the sidecar index of an uncompressed log
+            file. Defaults to False.
+
+    Returns:
+        list: The partially filled parsers of the run logs.
+    """
+    if compression_opener(logfile) is not None:
+        parser = MultiLogParser(progress_sections=())
+        for line in readers[reader](logfile):
+            parser.parse(line)
+        return parser.parsers
+
+    runs = read_index(logfile)
+    if runs is None:
+        runs = find_runs(logfile)
+        if index:
+            write_index(logfile, runs)
+
+    parsers = []
+    for run in runs:
+        parser = SingleLogParser(progress_sections=())
+        lines = read_lines_range(
+            logfile,
+            run["start"],
+            run["end"],
+            errors=reader_errors[reader],
+            chunk_size=1 << 16,
+        )
+        for line in lines:
+            if line.startswith("Presolve"):
+                break
+            parser.parse(line)
+            if parser.current_parser not in (
+                parser.header_parser,
+                parser.presolve_parser,
+            ):
+                break
+        lines.close()
+        parsers.append(parser)
+    return parsers
+
+
+def parse_segment(
+    logfile: str,
+    start: int,
+    end: int,
+    reader: str = "text",
+    progress_sections=PROGRESS_SECTIONS,
+):
+    """Parse a segment of the log file.
+
+    This is a module level function so that it can be sent to worker processes.
+
+    Returns:
+        tuple: The first line of the segment, whether it was matched, and the
+            parsers of the run logs in the segment.
+    """
+    if end is None:
+        lines = readers[reader](logfile)
+    else:
+        lines = read_lines_range(logfile, start, end, errors=reader_errors[reader])
+    parser = MultiLogParser(progress_sections=progress_sections)
+    first_line = next(lines, "")
+    matched = parser.parse(first_line)
+    for line in lines:
+        parser.parse(line)
+    return first_line, matched, parser.parsers
+
+
+def stitch_segments(segments: list):
+    """Join the parsed segments of a log file in order.
+
+    Returns:
+        list: The parsers of all run logs in the file, or None if a segment
+            does not start a new run log as it would in a sequential parse.
+    """
+    parsers = []
+    for first_line, matched, segment_parsers in segments:
+        if parsers and (not matched or parsers[-1].parse(first_line)):
+            return None
+        parsers.extend(segment_parsers)
+    return parsers
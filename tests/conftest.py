@@ -0,0 +1,34 @@
+import glob
+
+import pytest
+
+
+@pytest.fixture
+def merged_text():
+    """The contents of the glass4 logs, one run after the other."""
+    text = []
+    for path in sorted(glob.glob("data/912-glass4-*.log")):
+        with open(path) as infile:
+            text.append(infile.read())
+    return "".join(text)
+
+
+@pytest.fixture
+def merged_log(tmp_path, merged_text):
+    """A log file holding the glass4 runs one after the other."""
+    logfile = tmp_path / "merged.log"
+    logfile.write_text(merged_text)
+    return str(logfile)
+
+
+@pytest.fixture
+def forbid(monkeypatch):
+    """Make calls to the given attribute of a module fail the test."""
+
+    def forbid(target, name):
+        def fail(*args, **kwargs):
+            raise AssertionError(f"{name} was called")
+
+        monkeypatch.setattr(target, name, fail)
+
+    return forbid
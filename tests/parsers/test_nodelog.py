@@ -1,5 +1,5 @@
 from grblogtools.parsers.nodelog import NodeLogParser
-from grblogtools.parsers.util import parse_block
+from grblogtools.parsers.util import parse_block, typeconvert_groupdict
 
 nodelog_section_test_data = """
 Variable types: 19 continuous, 297 integer (297 binary)
@@ -184,3 +184,32 @@ def test_nodelog_parser():
             "Time": 35.66,
         },
     ]
+
+
+def test_parse_row():
+    """The tokenizer fast path gives the same entries as the row regexes and
+    leaves unclear lines to the regexes."""
+    parser = NodeLogParser()
+    for line in nodelog_section_test_data.strip().split("\n"):
+        for regex in parser.line_types:
+            match = regex.match(line)
+            if match:
+                assert parser.parse_row(line) == typeconvert_groupdict(match)
+                break
+        else:
+            assert parser.parse_row(line) is None
+    assert (
+        parser.parse_row("H    0     0   2.2e+09 8.0e+08  63.6%  -  0s extra") is None
+    )
+    assert parser.parse_row(" 12 5 8.0000e+08 0 72 - 8.0000e+08 74.5% - 0sec") is None
+
+
+def test_no_collect():
+    """Rows are matched without being collected, giving the same summary and
+    final statistics."""
+    expected = NodeLogParser()
+    parser = NodeLogParser(collect=False)
+    for line in nodelog_section_test_data.strip().split("\n"):
+        assert parser.parse(line) == expected.parse(line)
+    assert parser.get_summary() == expected.get_summary()
+    assert parser.get_progress() == expected.get_progress()[-1:]
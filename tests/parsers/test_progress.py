@@ -0,0 +1,67 @@
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from grblogtools.parsers.progress import ProgressTable
+
+rows = [
+    {"CurrentNode": 0, "Obj": 8e8, "Incumbent": None, "Gap": 0.745, "Time": 0},
+    {"NewSolution": "H", "CurrentNode": 0, "Incumbent": 2.2e9, "Time": 0},
+    {"CurrentNode": 29986, "Obj": 1.5e9, "Incumbent": 1.65e9, "Gap": 0.46, "Time": 15},
+    {"CurrentNode": 40414, "Pruned": "infeasible", "Incumbent": 1.6e9, "Time": 25},
+    {"NewSolution": "*", "CurrentNode": 187499, "Incumbent": 1.35e9, "Time": 35.5},
+]
+
+
+def make_table(rows):
+    table = ProgressTable()
+    for row in rows:
+        table.append(row)
+    return table
+
+
+def test_records():
+    table = make_table(rows)
+    assert len(table) == 5
+    assert table.to_records() == rows
+    assert table.last() == rows[-1]
+
+
+def test_columns():
+    """Columns give the same frame as pandas builds from the rows."""
+    table = make_table(rows)
+    assert_frame_equal(pd.DataFrame(table.to_columns()), pd.DataFrame(rows))
+
+
+def test_columns_all_none():
+    rows = [{"Time": 1, "BestBd": None}, {"Time": 2, "BestBd": None}]
+    table = make_table(rows)
+    assert_frame_equal(pd.DataFrame(table.to_columns()), pd.DataFrame(rows))
+
+
+def test_dtypes():
+    ring = ProgressTable(maxlen=2)
+    for row in rows[:3]:
+        ring.append(row)
+    for table in [make_table(rows), make_table(rows[:2]), ring]:
+        dtypes = table.dtypes()
+        columns = table.to_columns()
+        assert dtypes == {name: data.dtype for name, data in columns.items()}
+
+
+def test_copy_extend():
+    table = make_table(rows[:2])
+    copy = table.copy()
+    copy.extend(make_table(rows[2:]))
+    assert table.to_records() == rows[:2]
+    assert copy.to_records() == rows
+
+
+def test_maxlen():
+    table = ProgressTable(maxlen=2)
+    for row in rows:
+        table.append(row)
+        assert len(table) <= 2
+    assert table.to_records() == rows[-2:]
+    assert_frame_equal(
+        pd.DataFrame(table.to_columns()), pd.DataFrame(rows[-2:]), check_like=True
+    )
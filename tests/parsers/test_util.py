@@ -1,6 +1,15 @@
+import datetime
+import re
+
 import pytest
 
-from grblogtools.parsers.util import model_type
+from grblogtools.parsers.util import (
+    NUMBER_KEY,
+    CombinedPattern,
+    convert_field,
+    line_key,
+    model_type,
+)
 
 
 @pytest.mark.parametrize(
@@ -18,3 +27,67 @@ from grblogtools.parsers.util import model_type
 )
 def test_model_type(kwargs, result):
     assert model_type(**kwargs) == result
+
+
+@pytest.mark.parametrize(
+    "line, key",
+    [
+        ("\n", None),
+        ("Gurobi Optimizer version 9.5.0 build v9.5.0rc5 (mac64[arm])", "Gurobi"),
+        ("Presolved: 390 rows, 316 columns, 1803 nonzeros", "Presolved"),
+        (
+            " Expl Unexpl |  Obj  Depth IntInf | Incumbent    BestBd   Gap | It/Node Time",
+            "Expl",
+        ),
+        (
+            "     0     0 8.0000e+08    0   72          - 8.0000e+08  74.5%     -    0s",
+            NUMBER_KEY,
+        ),
+        (
+            "H    0     0                    2.200019e+09 8.0000e+08  63.6%     -    0s",
+            "H",
+        ),
+        (
+            "*187499 14704             320    1.350013e+09 1.2000e+09  11.1%   7.3   35s",
+            "*",
+        ),
+        ("Heuristic: 3", "Heuristic"),
+    ],
+)
+def test_line_key(line, key):
+    assert line_key(line) == key
+
+
+def test_combined_pattern():
+    """The first matching pattern wins and duplicate group names are allowed."""
+    combined = CombinedPattern(
+        [
+            re.compile(r"(?P<OPTIMAL>Optimal solution found)"),
+            re.compile(r"Solution count (?P<SolCount>\d+)"),
+            re.compile(r"(?P<Name>\w+) count (?P<Count>\d+)"),
+            re.compile(r"(?P<Name>.*)$"),
+        ]
+    )
+    assert combined.match("Solution count 4") == (1, {"SolCount": "4"})
+    assert combined.match("Thread count 8") == (2, {"Name": "Thread", "Count": "8"})
+    assert combined.match("anything") == (3, {"Name": "anything"})
+    assert CombinedPattern([re.compile("a")]).match("b") is None
+
+
+@pytest.mark.parametrize(
+    "name, value, result",
+    [
+        ("CurrentNode", "29986", 29986),
+        ("Incumbent", "1.6500e+09", 1.65e9),
+        ("Incumbent", "-", None),
+        ("Gap", "74.5%", 0.745),
+        ("Version", "9.5", "9.5"),
+        ("Time", "15", 15),
+        ("Time", "Wed Apr  6 10:12:13 2022", datetime.datetime(2022, 4, 6, 10, 12, 13)),
+        ("ErrorCode", "10001", 10001),
+    ],
+)
+def test_convert_field(name, value, result):
+    converted = convert_field(name, value)
+    assert converted == result
+    assert type(converted) is type(result)
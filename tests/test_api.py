@@ -1,5 +1,5 @@
+import asyncio
 import glob
-import tempfile
 
 import pandas as pd
 import pytest
@@ -39,16 +39,6 @@ def testlog_progress():
     }
 
 
-@pytest.fixture(scope="module")
-def merged_log():
-    with tempfile.NamedTemporaryFile("w") as fp:
-        for path in sorted(glob.glob("data/912-glass4-*.log")):
-            with open(path) as infile:
-                fp.writelines(infile.readlines())
-        fp.flush()
-        yield fp.name
-
-
 def test_merged_log(merged_log):
     summary = glt.parse(merged_log).summary()
     result = summary[["Seed", "Runtime", "LogFilePath", "LogNumber"]]
@@ -69,6 +59,15 @@ def test_summary(testlog_summary):
     )
 
 
+def test_summary_dtypes(testlog_summary):
+    for column in ["Status", "ModelType", "Platform"]:
+        assert isinstance(testlog_summary[column].dtype, pd.CategoricalDtype)
+    assert testlog_summary["Time"].dtype == "datetime64[ns]"
+    assert is_integer_dtype(testlog_summary["NumVars"])
+    assert is_integer_dtype(testlog_summary["LogNumber"])
+    assert testlog_summary["Runtime"].dtype == "float64"
+
+
 def test_progress(testlog_progress):
     assert len(testlog_progress) == 3
     assert len(testlog_progress["norel"]) == 15
@@ -192,3 +191,100 @@ def test_work():
 
     # Check if Runtime and Work found
     assert summary["Work"].count() == 6
+
+
+def test_parallel_parse(glass4_summary):
+    """Parsing with a process pool gives the same result as a serial parse."""
+    summary = glt.parse("data/*.log", jobs=4).summary()
+    assert_frame_equal(summary, glass4_summary)
+
+
+def test_parse_async(glass4_summary, glass4_progress):
+    """Parsing files read by an executor gives the same result as parse()."""
+    result = asyncio.run(glt.parse_async(["data/*.log"], concurrency=3))
+    assert_frame_equal(result.summary(), glass4_summary)
+    assert_frame_equal(result.progress("nodelog"), glass4_progress["nodelog"])
+    result = asyncio.run(glt.parse_async("data/*.log", progress=False))
+    assert_frame_equal(result.summary(), glass4_summary)
+    with pytest.raises(ValueError):
+        asyncio.run(glt.parse_async("data/*.log", concurrency=0))
+
+
+def test_summary_only(glass4_summary):
+    """Skipping progress collection gives the same summary."""
+    result = glt.parse("data/*.log", progress=False)
+    assert_frame_equal(result.summary(), glass4_summary)
+    with pytest.raises(ValueError):
+        result.progress("nodelog")
+    # Only the final statistics are kept
+    for _, _, parser in result.parsers:
+        assert len(parser.nodelog_parser.get_progress()) == 1
+
+
+def test_progress_sections(glass4_progress):
+    result = glt.parse("data/*.log", progress={"nodelog"})
+    assert_frame_equal(result.progress("nodelog"), glass4_progress["nodelog"])
+    with pytest.raises(ValueError):
+        result.progress("rootlp")
+    with pytest.raises(ValueError):
+        glt.parse("data/*.log", progress={"unknown"})
+
+
+def test_progress_normalized(glass4_progress):
+    result = glt.parse("data/*.log")
+    progress = result.progress("nodelog", normalized=True)
+    runs = result.runs()
+    assert runs.index.name == "LogId"
+    assert len(runs) == len(result.parsers)
+    assert "LogFilePath" not in progress.columns
+    # Joining the runs table on LogId gives the default progress frame
+    joined = progress.join(runs, on="LogId").drop(columns="LogId")
+    expected = glass4_progress["nodelog"]
+    assert isinstance(expected["Log"].dtype, pd.CategoricalDtype)
+    categories = expected.select_dtypes("category").columns
+    assert_frame_equal(joined, expected.astype(dict.fromkeys(categories, object)))
+
+
+def test_progress_compact(glass4_progress):
+    result = glt.parse("data/*.log")
+    expected = glass4_progress["nodelog"]
+    compact = result.progress("nodelog", compact=True)
+    assert compact.memory_usage(deep=True).sum() < (
+        expected.memory_usage(deep=True).sum() / 2
+    )
+    assert compact["Depth"].dtype.itemsize < 8
+    categories = dict.fromkeys(compact.select_dtypes("category").columns, object)
+    assert_frame_equal(
+        compact.astype(categories),
+        expected.astype(categories),
+        check_dtype=False,
+        rtol=2.0**-24,
+    )
+    _, timelines = glt.get_dataframe(["data/*.log"], timelines=True, compact=True)
+    assert_frame_equal(timelines["nodelog"], compact)
+
+
+def test_cached_frames(forbid):
+    """Frames extended as files are parsed match frames built from scratch."""
+    paths = (
+        sorted(glob.glob("tests/assets/*.log")) + sorted(glob.glob("data/*.log"))[:5]
+    )
+    result = glt.api.ParseResult()
+    for path in paths:
+        result.parse(path)
+        expected = glt.api.ParseResult()
+        expected.parsers = list(result.parsers)
+        assert_frame_equal(result.summary(), expected.summary())
+        assert_frame_equal(
+            result.summary(prettyparams=True), expected.summary(prettyparams=True)
+        )
+        assert_frame_equal(result.common_log_data(), expected.common_log_data())
+        for section in ["norel", "rootlp", "nodelog"]:
+            assert_frame_equal(result.progress(section), expected.progress(section))
+
+    # Cached frames are not rebuilt, and changes to returned frames do not
+    # affect them
+    forbid(glt.api, "summary_rows")
+    summary = result.summary()
+    summary["Runtime"] = 0
+    assert_frame_equal(result.summary(), expected.summary())
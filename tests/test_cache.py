@@ -0,0 +1,105 @@
+import os
+import shutil
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+import grblogtools as glt
+import grblogtools.api
+from grblogtools.cache import ParseCache
+
+
+@pytest.fixture
+def logdir(tmp_path):
+    logdir = tmp_path / "logs"
+    logdir.mkdir()
+    for name in ["912-glass4-0.log", "912-glass4-1.log", "912-Cuts0-glass4-0.log"]:
+        shutil.copy(os.path.join("data", name), logdir)
+    return logdir
+
+
+def test_cache(tmp_path, logdir, forbid):
+    pattern = str(logdir / "*.log")
+    cache_dir = str(tmp_path / "cache")
+    expected = glt.parse(pattern)
+    result = glt.parse(pattern, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 3
+    assert_frame_equal(result.summary(), expected.summary())
+
+    # Unchanged files are not parsed again
+    forbid(grblogtools.api, "parse_logfile")
+    cached = glt.parse(pattern, cache_dir=cache_dir)
+    assert_frame_equal(cached.summary(), expected.summary())
+    assert_frame_equal(cached.progress("nodelog"), expected.progress("nodelog"))
+
+
+def test_cache_stale(tmp_path, logdir):
+    pattern = str(logdir / "*.log")
+    cache_dir = tmp_path / "cache"
+    glt.parse(pattern, cache_dir=str(cache_dir))
+    before = set(os.listdir(cache_dir))
+
+    # A changed file is parsed again and its old entry removed
+    with open(logdir / "912-glass4-0.log") as infile:
+        lines = infile.readlines()
+    with open(logdir / "912-glass4-0.log", "w") as outfile:
+        outfile.writelines(lines[: len(lines) // 2])
+    result = glt.parse(pattern, cache_dir=str(cache_dir))
+    after = set(os.listdir(cache_dir))
+    assert len(after) == 3
+    assert len(before - after) == 1
+    assert result.summary()["Runtime"].isnull().sum() == 1
+
+
+def test_cache_size(tmp_path, logdir):
+    cache_dir = tmp_path / "cache"
+    glt.parse(str(logdir / "*.log"), cache_dir=str(cache_dir), cache_size=1)
+    assert len(os.listdir(cache_dir)) == 0
+
+
+def test_cache_progress(tmp_path, logdir):
+    """Entries parsed without progress are not used when progress is needed."""
+    pattern = str(logdir / "*.log")
+    cache_dir = str(tmp_path / "cache")
+    expected = glt.parse(pattern)
+    glt.parse(pattern, cache_dir=cache_dir, progress=False)
+    result = glt.parse(pattern, cache_dir=cache_dir)
+    assert_frame_equal(result.progress("nodelog"), expected.progress("nodelog"))
+    summary = glt.parse(pattern, cache_dir=cache_dir, progress=False).summary()
+    assert_frame_equal(summary, expected.summary())
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"cgrblogtools.removed\nParser\n.",
+        b"cgrblogtools.api\nRemovedParser\n.",
+        b"\x80\x05garbage",
+    ],
+)
+def test_cache_incompatible(tmp_path, logdir, data):
+    """Entries written by another version of the package are parsed again."""
+    pattern = str(logdir / "*.log")
+    cache_dir = tmp_path / "cache"
+    expected = glt.parse(pattern, cache_dir=str(cache_dir)).summary()
+    for entry in cache_dir.iterdir():
+        entry.write_bytes(data)
+    cache = ParseCache(str(cache_dir))
+    logfile = str(logdir / "912-glass4-0.log")
+    assert cache.load(logfile, cache.key(logfile)) is None
+    assert len(os.listdir(cache_dir)) == 2
+    result = glt.parse(pattern, cache_dir=str(cache_dir))
+    assert_frame_equal(result.summary(), expected)
+    for entry in cache_dir.iterdir():
+        assert entry.read_bytes() != data
+
+
+def test_cache_reader(tmp_path, logdir):
+    """Entries of readers replacing invalid bytes are not used by strict ones."""
+    logfile = logdir / "912-glass4-0.log"
+    logfile.write_bytes(logfile.read_bytes().replace(b"glass4", b"glass\xff", 1))
+    cache_dir = str(tmp_path / "cache")
+    glt.parse(str(logfile), reader="mmap", cache_dir=cache_dir)
+    with pytest.raises(UnicodeDecodeError):
+        glt.parse(str(logfile), cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
@@ -0,0 +1,96 @@
+import os
+
+import pandas as pd
+import pytest
+
+import grblogtools as glt
+from grblogtools.cli import cli
+
+
+def run_cli(monkeypatch, *args):
+    monkeypatch.setattr("sys.argv", ["grblogtools", *args])
+    cli(glt_parse=glt.parse, argparse_kwargs={})
+
+
+def test_summary_only(monkeypatch, tmp_path):
+    """Without timelines, no progress rows are collected or written."""
+
+    def parse(patterns, **kwargs):
+        assert kwargs["progress"] is False
+        return glt.parse(patterns, **kwargs)
+
+    outdir = str(tmp_path / "serial")
+    monkeypatch.setattr(
+        "sys.argv", ["grblogtools", "--format", "csv", outdir, "data/*.log"]
+    )
+    cli(glt_parse=parse, argparse_kwargs={})
+    assert os.listdir(outdir) == ["summary.csv"]
+    outdir = str(tmp_path / "parallel")
+    run_cli(monkeypatch, "--format", "csv", "-j", "2", outdir, "data/*.log")
+    assert os.listdir(outdir) == ["summary.csv"]
+    assert pd.read_csv(tmp_path / "serial" / "summary.csv").equals(
+        pd.read_csv(tmp_path / "parallel" / "summary.csv")
+    )
+
+
+@pytest.mark.parametrize("format", ["csv", "jsonl"])
+def test_timelines(monkeypatch, tmp_path, format):
+    run_cli(monkeypatch, "-t", "--format", format, str(tmp_path), "data/*.log")
+    assert sorted(os.listdir(tmp_path)) == [
+        f"{name}.{format}" for name in ["nodelog", "norel", "rootlp", "summary"]
+    ]
+    if format == "jsonl":
+        nodelog = pd.read_json(tmp_path / "nodelog.jsonl", lines=True)
+    else:
+        nodelog = pd.read_csv(tmp_path / "nodelog.csv")
+    assert len(nodelog) == len(glt.parse("data/*.log").progress("nodelog"))
+
+
+def test_xlsx(monkeypatch, tmp_path):
+    pytest.importorskip("openpyxl")
+    run_cli(monkeypatch, str(tmp_path / "summary.xlsx"), "data/*.log")
+    assert list(pd.read_excel(tmp_path / "summary.xlsx", sheet_name=None)) == [
+        "Summary"
+    ]
+    run_cli(monkeypatch, "-t", str(tmp_path / "all.xlsx"), "data/*.log")
+    assert list(pd.read_excel(tmp_path / "all.xlsx", sheet_name=None)) == [
+        "Summary",
+        "norel",
+        "rootlp",
+        "nodelog",
+    ]
+
+
+def test_cache_size_requires_cache_dir(monkeypatch, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        run_cli(monkeypatch, "--cache-size", "10", str(tmp_path / "out.xlsx"), "x")
+    assert "--cache-size requires --cache-dir" in capsys.readouterr().err
+
+
+def test_parse_hook(monkeypatch, tmp_path):
+    """Parse functions taking only the patterns work with default options."""
+    monkeypatch.setattr(
+        "sys.argv",
+        ["grblogtools", "-t", "--format", "csv", str(tmp_path), "data/*.log"],
+    )
+    cli(glt_parse=lambda patterns: glt.parse(patterns), argparse_kwargs={})
+    assert "nodelog.csv" in os.listdir(tmp_path)
+
+
+@pytest.mark.parametrize("jobs", ["-1", "x"])
+def test_invalid_jobs(monkeypatch, tmp_path, capsys, jobs):
+    with pytest.raises(SystemExit):
+        run_cli(monkeypatch, "-j", jobs, str(tmp_path / "out.xlsx"), "x")
+    assert "argument -j/--jobs" in capsys.readouterr().err
+
+
+def test_all_cpus(monkeypatch, tmp_path):
+    def parse(patterns, **kwargs):
+        assert kwargs["jobs"] is None
+        return glt.parse(patterns, **kwargs)
+
+    monkeypatch.setattr(
+        "sys.argv",
+        ["grblogtools", "-j", "0", "--format", "csv", str(tmp_path), "data/*.log"],
+    )
+    cli(glt_parse=parse, argparse_kwargs={})
@@ -0,0 +1,137 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+import grblogtools as glt
+import grblogtools.export
+from grblogtools.export import batches, progress_dtypes, write_xlsx
+
+
+@pytest.fixture(scope="module")
+def result():
+    return glt.parse(["data/*.log", "tests/assets/*.log"])
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    monkeypatch.setattr(grblogtools.export, "BATCH_ROWS", 100)
+
+
+def expected_frame(frame):
+    """Return the frame as read back from a file, with categoricals written as
+    their values."""
+    categories = frame.select_dtypes("category").columns
+    return frame.astype(dict.fromkeys(categories, object))
+
+
+def read_partitions(path, read):
+    return pd.concat(
+        [read(filename) for filename in sorted(glob.glob(f"{path}/*/*/part-*"))],
+        ignore_index=True,
+    )
+
+
+def test_progress_dtypes(result):
+    for section in ["norel", "rootlp", "nodelog"]:
+        # pandas turns integer columns into floats next to empty frames
+        runs = [
+            run for run in result.parsers if len(run[2].get_progress_table(section))
+        ]
+        dtypes = progress_dtypes(section, runs)
+        progress = result._subset(runs).progress(section, normalized=True)
+        progress = progress.drop(columns="LogId")
+        assert list(dtypes) == list(progress.columns)
+        assert dtypes == dict(progress.dtypes.items())
+
+
+def test_batches(result, small_batches):
+    runs = list(batches("nodelog", result.parsers))
+    assert len(runs) > 1
+    assert sum(runs, []) == result.parsers
+
+
+def test_csv(result, tmp_path, small_batches):
+    result.to_csv(tmp_path)
+    assert sorted(os.listdir(tmp_path)) == [
+        "nodelog.csv",
+        "norel.csv",
+        "rootlp.csv",
+        "summary.csv",
+    ]
+    summary = pd.read_csv(tmp_path / "summary.csv")
+    assert len(summary) == len(result.parsers)
+    nodelog = pd.read_csv(tmp_path / "nodelog.csv")
+    expected = result.progress("nodelog")
+    assert list(nodelog.columns) == list(expected.columns)
+    assert_frame_equal(
+        nodelog[["Incumbent", "BestBd"]], expected[["Incumbent", "BestBd"]]
+    )
+
+
+def test_csv_partitioned(result, tmp_path, small_batches):
+    result.to_csv(tmp_path, partition_by=["Version", "Model"], sections=["nodelog"])
+    assert sorted(os.listdir(tmp_path)) == ["nodelog", "summary"]
+    assert os.path.exists(tmp_path / "nodelog" / "Version=9.1.2" / "Model=glass4")
+    nodelog = read_partitions(tmp_path / "nodelog", pd.read_csv)
+    assert len(nodelog) == len(result.progress("nodelog"))
+    assert "Version" not in nodelog.columns
+    # Partitioned outputs are not written into existing directories
+    with pytest.raises(FileExistsError):
+        result.to_csv(tmp_path, partition_by=["Version"])
+
+
+@pytest.mark.parametrize("format", ["parquet", "feather"])
+def test_arrow(result, tmp_path, small_batches, format):
+    pytest.importorskip("pyarrow")
+    read = getattr(pd, f"read_{format}")
+    getattr(result, f"to_{format}")(tmp_path)
+    for section in ["norel", "rootlp", "nodelog"]:
+        frame = read(tmp_path / f"{section}.{format}")
+        expected = expected_frame(result.progress(section))
+        assert_frame_equal(frame, expected, check_dtype=False)
+    summary = read(tmp_path / f"summary.{format}")
+    assert_frame_equal(summary, result.summary(), check_dtype=False)
+
+
+@pytest.mark.parametrize("format", ["parquet", "feather"])
+def test_arrow_partitioned(result, tmp_path, small_batches, format):
+    pytest.importorskip("pyarrow")
+    read = getattr(pd, f"read_{format}")
+    getattr(result, f"to_{format}")(tmp_path, partition_by=["Version", "Model"])
+    nodelog = read_partitions(tmp_path / "nodelog", read)
+    expected = result.progress("nodelog").drop(columns=["Version", "Model"])
+    assert len(nodelog) == len(expected)
+    assert list(nodelog.columns) == list(expected.columns)
+
+
+def test_unknown_format(result, tmp_path):
+    with pytest.raises(ValueError):
+        glt.api.write_result(result, tmp_path, "xls")
+
+
+def test_xlsx_overflow(result, tmp_path, small_batches, monkeypatch):
+    pytest.importorskip("openpyxl")
+    monkeypatch.setattr(grblogtools.export, "EXCEL_MAX_ROWS", 1000)
+    path = tmp_path / "result.xlsx"
+    write_xlsx(result, path)
+    sheets = pd.read_excel(path, sheet_name=None, index_col=0)
+    assert list(sheets) == [
+        "Summary",
+        "norel",
+        "rootlp",
+        "nodelog",
+        "nodelog_2",
+        "nodelog_3",
+        "nodelog_4",
+    ]
+    assert all(len(sheet) < 1000 for sheet in sheets.values())
+    nodelog = pd.concat([sheets[name] for name in sheets if "nodelog" in name])
+    expected = result.progress("nodelog")
+    assert nodelog.index.tolist() == expected.index.tolist()
+    assert_frame_equal(
+        nodelog[["Incumbent", "BestBd"]], expected[["Incumbent", "BestBd"]]
+    )
+    assert len(sheets["Summary"]) == len(result.parsers)
@@ -0,0 +1,112 @@
+import glob
+import os
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+import grblogtools as glt
+from grblogtools.fast_summary import parse_head_tail
+
+
+def long_lines(logfile):
+    """The lines of a MIP log with the first tree search row repeated many
+    times, as if the search stayed at the root node."""
+    with open(logfile) as infile:
+        lines = infile.readlines()
+    start = next(i for i, line in enumerate(lines) if "Expl Unexpl" in line) + 2
+    row = next(line for line in lines[start:] if line.startswith(" "))
+    return lines[:start] + [row] * 20000 + lines[start:]
+
+
+@pytest.fixture
+def long_log(tmp_path):
+    """A glass4 log with a long tree search table."""
+    logfile = tmp_path / "long.log"
+    with open(logfile, "w") as outfile:
+        outfile.writelines(long_lines("data/912-glass4-0.log"))
+    return str(logfile)
+
+
+def test_fast_summary(long_log):
+    parsers = parse_head_tail(long_log, size=10000)
+    assert parsers is not None
+    expected = glt.parse(long_log).summary()
+    assert_frame_equal(glt.parse(long_log, fast_summary=True).summary(), expected)
+
+
+@pytest.mark.parametrize("logfile", sorted(glob.glob("data/*.log")))
+def test_fast_summary_generated(tmp_path, logfile):
+    """The summary from the head and tail matches a full parse."""
+    long_log = str(tmp_path / "long.log")
+    with open(long_log, "w") as outfile:
+        outfile.writelines(long_lines(logfile))
+    parsers = parse_head_tail(long_log, size=10000)
+    assert parsers is not None
+    expected = glt.api.parse_logfile(long_log, progress_sections=())
+    assert [parser.get_summary() for parser in parsers] == [
+        parser.get_summary() for _, _, parser in expected
+    ]
+
+
+def test_fast_summary_fallback(merged_log):
+    # LP logs have no tree search, small files are parsed completely
+    assert parse_head_tail("tests/assets/lp_barrier.log", size=1024) is None
+    assert parse_head_tail("data/912-glass4-0.log") is None
+    # A run log starting in the tail is detected
+    assert parse_head_tail(merged_log, size=4096) is None
+    summary = glt.parse(merged_log, fast_summary=True).summary()
+    assert_frame_equal(summary, glt.parse(merged_log).summary())
+
+
+def test_fast_summary_discontinuous(tmp_path):
+    """A tail table which does not continue the head table is parsed completely."""
+    with open("data/912-glass4-0.log") as infile:
+        lines = infile.readlines()
+    start = next(i for i, line in enumerate(lines) if "Expl Unexpl" in line) + 2
+    end = next(i for i, line in enumerate(lines) if line.startswith("Cutting planes"))
+    rows = [line for line in lines[start:end] if line.startswith(" ")]
+    logfile = str(tmp_path / "restarted.log")
+    for first, last, expected in [
+        (rows[0], rows[-1], True),
+        (rows[-1], rows[0], False),
+    ]:
+        with open(logfile, "w") as outfile:
+            outfile.writelines(lines[:start] + [first] * 20000 + [last] * 20000)
+            outfile.writelines(lines[end - 1 :])
+        assert (parse_head_tail(logfile, size=10000) is not None) is expected
+    summary = glt.parse(logfile, fast_summary=True).summary()
+    assert_frame_equal(summary, glt.parse(logfile).summary())
+
+
+def test_fast_summary_hidden_runs(tmp_path):
+    """Run logs in the skipped middle of the file are found through the index."""
+    logfile = str(tmp_path / "mip_lp_mip.log")
+    with open(logfile, "w") as outfile:
+        outfile.writelines(long_lines("data/912-glass4-0.log"))
+        with open("tests/assets/lp_barrier.log") as infile:
+            outfile.write(infile.read())
+        outfile.writelines(long_lines("data/912-glass4-1.log"))
+    glt.scan(logfile, index=True)
+    assert parse_head_tail(logfile, size=10000) is None
+    summary = glt.parse(logfile, fast_summary=True).summary()
+    assert len(summary) == 3
+    assert_frame_equal(summary, glt.parse(logfile).summary())
+
+
+def test_fast_summary_cache(tmp_path, long_log, monkeypatch):
+    """Head and tail summaries are cached apart from full parses."""
+    cache_dir = str(tmp_path / "cache")
+    fast = glt.parse(long_log, fast_summary=True, cache_dir=cache_dir).summary()
+    assert len(os.listdir(cache_dir)) == 1
+    parsed = []
+    parse_logfile = glt.api.parse_logfile
+    monkeypatch.setattr(
+        glt.api,
+        "parse_logfile",
+        lambda logfile, *args: parsed.append(logfile) or parse_logfile(logfile, *args),
+    )
+    glt.parse(long_log, progress=False, cache_dir=cache_dir)
+    assert parsed == [long_log]
+    assert len(os.listdir(cache_dir)) == 2
+    cached = glt.parse(long_log, fast_summary=True, cache_dir=cache_dir).summary()
+    assert_frame_equal(cached, fast)
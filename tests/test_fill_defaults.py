@@ -96,3 +96,30 @@ def test_fill_default_parameters_nosuffix():
         ]
     )
     assert_frame_equal(filled.sort_index(axis=1), expected.sort_index(axis=1))
+
+
+def test_fill_defaults_fallback():
+    """Unknown versions use the 950 defaults, rows without a version are left
+    unfilled."""
+    parameters = pd.DataFrame(
+        [
+            {"Version": "99.0.0", "MIPFocus": 1},
+            {"Version": "9.5.0", "Heuristics": 0.5},
+            {"Version": None, "MIPFocus": 2},
+        ]
+    )
+    filled = fill_default_parameters_nosuffix(parameters)
+    assert filled["MIPFocus"].tolist()[:2] == [1, 0]
+    assert filled["MIPFocus"].iloc[2] == 2
+    assert filled["Heuristics"].tolist()[:2] == [0.05, 0.5]
+    assert pd.isnull(filled["Heuristics"].iloc[2])
+
+
+def test_fill_defaults_dtypes():
+    parameters = pd.DataFrame(
+        [{"Version": "9.1.2", "MIPFocus": 1}, {"Version": "8.1.1", "Threads": 4}]
+    )
+    filled = fill_default_parameters_nosuffix(parameters)
+    assert is_integer_dtype(filled["MIPFocus"])
+    assert is_integer_dtype(filled["Threads"])
+    assert filled["Version"].tolist() == ["9.1.2", "8.1.1"]
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+import grblogtools as glt
+
+
+def test_follow(tmp_path, merged_text):
+    """Following a log as it is written in chunks (splitting lines) gives the
+    same result as parsing the complete file."""
+    logfile = str(tmp_path / "running.log")
+    open(logfile, "w").close()
+    result = glt.follow(logfile)
+    for i in range(0, len(merged_text), 1000):
+        with open(logfile, "a") as outfile:
+            outfile.write(merged_text[i : i + 1000])
+        result.refresh()
+        if i == 5000:
+            # Frames cached part way are rebuilt after later refreshes
+            result.summary()
+            result.progress("nodelog")
+
+    expected = glt.parse(logfile)
+    assert len(result.parsers) == 3
+    assert_frame_equal(result.summary(), expected.summary())
+    assert_frame_equal(result.progress("nodelog"), expected.progress("nodelog"))
+
+
+def test_follow_partial_line(tmp_path):
+    logfile = str(tmp_path / "running.log")
+    with open(logfile, "w") as outfile:
+        outfile.write("Gurobi Optimizer version 9.5.0 build v9.5.0rc5 (mac64[arm])\n")
+        outfile.write("Thread count: 8 physical cores, 8 logical")
+    result = glt.follow(logfile)
+    assert "Threads" not in result.parsers[0][2].get_summary()
+    with open(logfile, "a") as outfile:
+        outfile.write(" processors, using up to 4 threads\n")
+    result.refresh()
+    assert result.parsers[0][2].get_summary()["Threads"] == 4
+
+
+def test_follow_progress_limit(tmp_path, merged_text):
+    logfile = str(tmp_path / "running.log")
+    with open(logfile, "w") as outfile:
+        outfile.write(merged_text)
+    result = glt.follow(logfile, progress_limit=10)
+    expected = glt.parse(logfile)
+    for (_, _, parser), (_, _, full_parser) in zip(result.parsers, expected.parsers):
+        progress = parser.nodelog_parser.get_progress()
+        # The limit applies to table rows, the final statistics are added after
+        assert len(progress) == 11
+        assert progress == full_parser.nodelog_parser.get_progress()[-11:]
+
+
+def test_follow_rewritten(tmp_path, merged_text):
+    """A truncated, rewritten or replaced file is parsed again from the start."""
+    logfile = str(tmp_path / "running.log")
+    with open(logfile, "w") as outfile:
+        outfile.write(merged_text)
+    result = glt.follow(logfile)
+    assert len(result.summary()) == 3
+
+    with open("data/912-glass4-0.log") as infile:
+        single = infile.read()
+    with open(logfile, "w") as outfile:
+        outfile.write(single)
+    result.refresh()
+    assert_frame_equal(result.summary(), glt.parse(logfile).summary())
+
+    # Rewritten beyond the previous offset
+    with open(logfile, "w") as outfile:
+        outfile.write(single.replace("Best objective", "Best  objective") + "\n")
+    result.refresh()
+    assert_frame_equal(result.summary(), glt.parse(logfile).summary())
+
+    replacement = str(tmp_path / "replacement.log")
+    with open(replacement, "w") as outfile:
+        outfile.write(merged_text)
+    os.replace(replacement, logfile)
+    result.refresh()
+    assert_frame_equal(result.summary(), glt.parse(logfile).summary())
+
+
+def test_follow_unchanged(tmp_path, merged_text, forbid):
+    """Cached frames are kept if nothing was appended."""
+    logfile = str(tmp_path / "running.log")
+    with open(logfile, "w") as outfile:
+        outfile.write(merged_text)
+    result = glt.follow(logfile)
+    summary = result.summary()
+    forbid(glt.api, "summary_rows")
+    result.refresh()
+    assert_frame_equal(result.summary(), summary)
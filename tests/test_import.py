@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import pytest
+
+import grblogtools as glt
+
+# Optional modules which are only imported once they are used (pyarrow is left
+# out, as pandas imports it whenever it is installed)
+LAZY_MODULES = {"plotly", "ipywidgets", "IPython", "xlsxwriter"}
+
+
+def imported_modules(statement):
+    """Return the top level packages imported by the statement in a fresh
+    interpreter."""
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+@pytest.mark.parametrize("statement", ["import grblogtools", "import grblogtools.cli"])
+def test_lazy_imports(statement):
+    assert imported_modules(statement).isdisjoint(LAZY_MODULES)
+
+
+def test_lazy_plot():
+    assert glt.plot.__module__ == "grblogtools.plotting"
+    with pytest.raises(AttributeError):
+        glt.missing
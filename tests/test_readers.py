@@ -0,0 +1,200 @@
+import asyncio
+import bz2
+import glob
+import gzip
+import io
+import lzma
+import threading
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+import grblogtools as glt
+from grblogtools.readers import (
+    read_chunks_background,
+    read_line_batches_async,
+    read_lines,
+    read_lines_mmap,
+    read_lines_pipelined,
+    split_line_batches,
+    split_lines,
+)
+
+
+@pytest.mark.parametrize(
+    "logfile",
+    sorted(glob.glob("data/912-glass4-*.log") + glob.glob("tests/assets/*.log")),
+)
+def test_mmap_lines(logfile):
+    expected = list(read_lines(logfile))
+    assert list(read_lines_mmap(logfile)) == expected
+    # Chunks smaller than a line are extended to the next line end
+    assert list(read_lines_mmap(logfile, chunk_size=10)) == expected
+
+
+def test_mmap_newlines(tmp_path):
+    logfile = tmp_path / "newlines.log"
+    logfile.write_bytes(b"a\r\nb\rc\n\nd")
+    assert list(read_lines_mmap(str(logfile))) == ["a\n", "b\n", "c\n", "\n", "d"]
+    empty = tmp_path / "empty.log"
+    empty.write_bytes(b"")
+    assert list(read_lines_mmap(str(empty))) == []
+
+
+def test_mmap_parse():
+    expected = glt.parse("tests/assets/*.log")
+    result = glt.parse("tests/assets/*.log", reader="mmap")
+    assert_frame_equal(result.summary(), expected.summary())
+    assert_frame_equal(result.progress("rootlp"), expected.progress("rootlp"))
+
+
+def test_mmap_invalid_utf8(tmp_path):
+    logfile = tmp_path / "invalid.log"
+    with open("tests/assets/mip.log", "rb") as infile:
+        logfile.write_bytes(b"\xff\xfe garbage\n" + infile.read())
+    with pytest.raises(UnicodeDecodeError):
+        glt.parse(str(logfile))
+    summary = glt.parse(str(logfile), reader="mmap").summary()
+    assert summary["Status"].iloc[0] == "TIME_LIMIT"
+
+
+def test_compressed_invalid_utf8(tmp_path):
+    """The text reader decodes compressed files as strictly as others."""
+    logfile = tmp_path / "invalid.log"
+    with open("tests/assets/mip.log", "rb") as infile:
+        logfile.write_bytes(gzip.compress(b"\xff\xfe garbage\n" + infile.read()))
+    with pytest.raises(UnicodeDecodeError):
+        glt.parse(str(logfile))
+    summary = glt.parse(str(logfile), reader="mmap").summary()
+    assert summary["Status"].iloc[0] == "TIME_LIMIT"
+
+
+def test_unknown_reader():
+    with pytest.raises(ValueError):
+        glt.parse("tests/assets/*.log", reader="unknown")
+
+
+@pytest.mark.parametrize("module", [gzip, bz2, lzma])
+def test_compressed(tmp_path, module):
+    """Compressed files are matched by the pattern of the uncompressed name
+    and give the same result as the uncompressed file."""
+    with open("data/912-glass4-0.log", "rb") as infile:
+        data = infile.read()
+    suffix = {gzip: ".gz", bz2: ".bz2", lzma: ".xz"}[module]
+    logfile = tmp_path / f"912-glass4-0.log{suffix}"
+    with module.open(logfile, "wb") as outfile:
+        outfile.write(data)
+
+    assert list(read_lines(str(logfile))) == list(read_lines("data/912-glass4-0.log"))
+    result = glt.parse(str(tmp_path / "*.log"))
+    expected = glt.parse("data/912-glass4-0.log")
+    summary = result.summary()
+    assert summary["LogFilePath"].tolist() == [str(logfile)]
+    assert summary["Log"].tolist() == ["912"]
+    assert_frame_equal(
+        summary.drop(columns="LogFilePath"),
+        expected.summary().drop(columns="LogFilePath"),
+    )
+
+
+def test_compressed_glob(tmp_path):
+    """Compressed copies of matched files and literal paths are not added."""
+    for name in ["a.log", "a.log.gz", "b.log.gz"]:
+        (tmp_path / name).write_bytes(b"")
+    logfiles = set(glt.api.glob_logfiles([str(tmp_path / "*.log")]))
+    assert logfiles == {str(tmp_path / "a.log"), str(tmp_path / "b.log.gz")}
+    logfiles = list(glt.api.glob_logfiles([str(tmp_path / "a.log")]))
+    assert logfiles == [str(tmp_path / "a.log")]
+
+
+def test_compressed_magic(tmp_path):
+    """Compression is detected from the contents rather than the name."""
+    logfile = tmp_path / "mip.log"
+    with open("tests/assets/mip.log", "rb") as infile:
+        logfile.write_bytes(gzip.compress(infile.read()))
+    summary = glt.parse(str(logfile)).summary()
+    assert summary["Status"].iloc[0] == "TIME_LIMIT"
+    assert list(read_lines_mmap(str(logfile))) == list(read_lines(str(logfile)))
+
+
+def test_split_lines():
+    chunks = [b"a\r", b"\nb", b"c\rd\n", b"\xffe"]
+    assert list(split_lines(chunks)) == ["a\n", "bc\n", "d\n", "�e"]
+
+
+def test_split_line_batches():
+    chunks = [b"a\r", b"\nb", b"c\rd\n", b"\xffe"]
+    batches = list(split_line_batches(chunks))
+    assert batches == [["a\n"], ["bc\n", "d\n"], ["\ufffde"]]
+
+
+@pytest.mark.parametrize(
+    "logfile",
+    sorted(glob.glob("data/912-glass4-*.log") + glob.glob("tests/assets/*.log")),
+)
+def test_pipelined_lines(logfile):
+    expected = list(read_lines(logfile))
+    assert list(read_lines_pipelined(logfile)) == expected
+    assert list(read_lines_pipelined(logfile, chunk_size=10, queue_size=1)) == expected
+
+
+def test_pipelined_parse(tmp_path):
+    expected = glt.parse("data/*.log")
+    result = glt.parse("data/*.log", reader="pipelined")
+    assert_frame_equal(result.summary(), expected.summary())
+    assert_frame_equal(result.progress("nodelog"), expected.progress("nodelog"))
+
+    logfile = tmp_path / "912-glass4-0.log"
+    with open("data/912-glass4-0.log", "rb") as infile:
+        logfile.write_bytes(gzip.compress(infile.read()))
+    result = glt.api.ParseResult()
+    result.parse(str(logfile), reader="pipelined")
+    assert_frame_equal(
+        result.progress("nodelog").drop(columns="LogFilePath"),
+        glt.parse("data/912-glass4-0.log")
+        .progress("nodelog")
+        .drop(columns="LogFilePath"),
+    )
+
+
+def test_pipelined_error(tmp_path):
+    """Errors of the background thread are raised by the reader."""
+    logfile = tmp_path / "truncated.log.gz"
+    with open("data/912-glass4-0.log", "rb") as infile:
+        logfile.write_bytes(gzip.compress(infile.read())[:-100])
+    with pytest.raises(EOFError):
+        list(read_lines_pipelined(str(logfile)))
+
+
+def test_read_chunks_background_stops_early():
+    """Abandoning the reader stops the background thread."""
+    chunks = read_chunks_background(io.BytesIO(b"x" * 100), chunk_size=1, queue_size=2)
+    assert next(chunks) == b"x"
+    chunks.close()
+
+
+def test_pipelined_stops_early():
+    threads = threading.active_count()
+    lines = read_lines_pipelined("data/912-glass4-0.log", chunk_size=10, queue_size=1)
+    assert next(lines) == next(read_lines("data/912-glass4-0.log"))
+    lines.close()
+    assert threading.active_count() == threads
+
+
+async def collect_async(logfile, chunk_size):
+    return [
+        line
+        async for lines in read_line_batches_async(logfile, chunk_size=chunk_size)
+        for line in lines
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 20])
+def test_line_batches_async(tmp_path, chunk_size):
+    expected = list(read_lines("data/912-glass4-0.log"))
+    lines = asyncio.run(collect_async("data/912-glass4-0.log", chunk_size))
+    assert lines == expected
+    logfile = tmp_path / "912-glass4-0.log.gz"
+    with open("data/912-glass4-0.log", "rb") as infile:
+        logfile.write_bytes(gzip.compress(infile.read()))
+    assert asyncio.run(collect_async(str(logfile), chunk_size)) == expected
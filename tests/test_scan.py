@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+import grblogtools as glt
+import grblogtools.segments
+from grblogtools.segments import find_runs, find_segments, index_path, read_index
+
+
+def test_scan():
+    """The inventory has the same run logs and header data as a full parse."""
+    inventory = glt.scan(["data/*.log", "tests/assets/*.log"])
+    summary = glt.parse(["data/*.log", "tests/assets/*.log"]).summary()
+    assert len(inventory) == len(summary)
+    merged = inventory.merge(summary, on=["LogFilePath", "LogNumber"])
+    for column in ["Version", "ModelName", "Fingerprint", "NumVars", "NumConstrs"]:
+        left, right = merged[f"{column}_x"], merged[f"{column}_y"]
+        assert ((left == right) | (left.isna() & right.isna())).all()
+    # Parsing stops at the start of the presolve output
+    assert "PresolveTime" not in inventory.columns
+
+
+def test_scan_merged(merged_log):
+    inventory = glt.scan(merged_log)
+    assert inventory["LogNumber"].tolist() == [1, 2, 3]
+    # The first run uses the default seed
+    assert inventory["Seed (Parameter)"].tolist()[1:] == [1, 2]
+
+
+def test_find_runs(merged_log):
+    runs = find_runs(merged_log)
+    with open(merged_log, "rb") as infile:
+        data = infile.read()
+    assert len(runs) == 3
+    assert runs[0]["start"] == 0
+    assert runs[-1]["end"] == len(data)
+    for run, next_run in zip(runs, runs[1:]):
+        assert run["end"] == next_run["start"]
+    for run in runs:
+        assert data[run["start"] :].lstrip().startswith(b"Gurobi")
+        assert data[run["presolve"] :].startswith(b"Optimize a model")
+        assert data[run["nodelog"] :].startswith(b" Expl Unexpl")
+        assert run["start"] < run["presolve"] < run["nodelog"] < run["end"]
+
+
+def test_index(merged_log, forbid):
+    assert read_index(merged_log) is None
+    glt.scan(merged_log, index=True)
+    assert os.path.exists(index_path(merged_log))
+    assert read_index(merged_log) == find_runs(merged_log)
+    # Index files are not taken for log files
+    assert len(glt.scan(os.path.join(os.path.dirname(merged_log), "*"))) == 3
+
+    # The index is used instead of the pre-scan
+    forbid(grblogtools.segments, "find_runs")
+    assert len(find_segments(merged_log, min_size=100)) == 3
+    assert len(glt.scan(merged_log)) == 3
+
+    # The index is ignored once the file changes
+    with open(merged_log, "a") as outfile:
+        outfile.write("\n")
+    assert read_index(merged_log) is None
@@ -0,0 +1,93 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from grblogtools.schema import (
+    append_rows,
+    compact_frame,
+    concat_columns,
+    convert_column,
+    summary_columns,
+)
+
+
+def test_append_rows():
+    columns = {}
+    length = append_rows(columns, 0, [{"NumVars": 1}, {"Status": "OPTIMAL"}])
+    length = append_rows(columns, length, [{"NumVars": 3, "Runtime": 1.5}])
+    assert length == 3
+    assert columns["NumVars"][0] == 1 and np.isnan(columns["NumVars"][1])
+    assert columns["Status"][1] == "OPTIMAL" and len(columns["Status"]) == 3
+    assert len(columns["Runtime"]) == 3 and columns["Runtime"][2] == 1.5
+
+
+def test_summary_columns():
+    columns = {
+        "NumVars": [1, 2],
+        "NumConstrs": [1, np.nan],
+        "Runtime": [1.5, None],
+        "Cuts: Gomory": [3, 4],
+        "Status": ["OPTIMAL", np.nan],
+        "Time": [datetime.datetime(2022, 1, 1), np.nan],
+        "ModelName": ["glass4", None],
+    }
+    result = summary_columns(columns)
+    assert result["NumVars"].dtype == np.int64
+    assert result["NumConstrs"].dtype == np.float64
+    assert result["Runtime"].dtype == np.float64
+    assert result["Cuts: Gomory"].dtype == np.int64
+    assert isinstance(result["Status"], pd.Categorical)
+    assert result["Time"].dtype == "datetime64[ns]"
+    assert result["ModelName"].dtype == object
+    assert result["ModelName"][1] is None
+
+
+def test_concat_columns():
+    first = [{"NumVars": 1, "Status": "OPTIMAL", "Flag": True}]
+    second = [
+        {"NumVars": 2, "Status": "INFEASIBLE", "Runtime": 1.5},
+        {"Status": "OPTIMAL", "ModelName": "glass4"},
+    ]
+    columns, added = {}, {}
+    length = append_rows(columns, 0, first)
+    added_length = append_rows(added, 0, second)
+    result = concat_columns(
+        summary_columns(columns), length, summary_columns(added), added_length
+    )
+    columns = {}
+    append_rows(columns, 0, first + second)
+    expected = summary_columns(columns)
+    assert list(result) == list(expected)
+    for name, data in expected.items():
+        pd.testing.assert_series_equal(pd.Series(result[name]), pd.Series(data))
+
+
+def test_convert_column_fallback():
+    # Values failing their declared conversion are left to pandas
+    assert convert_column("NumVars", [1, "x"]).tolist() == [1, "x"]
+    assert convert_column("Unknown", [1, 2]).dtype == np.int64
+
+
+def test_compact_frame():
+    frame = pd.DataFrame(
+        {
+            "Depth": [1, 2, 300],
+            "Nodes": [1.0, np.nan, 2.0**30],
+            "IntInf": [1.0, np.nan, 5.0],
+            "Gap": [0.1, 0.25, np.nan],
+            "Huge": [1e300, 1.0, 2.5],
+            "Type": ["H", None, "H"],
+            "Name": ["a", "b", "c"],
+        }
+    )
+    result = compact_frame(frame)
+    assert result["Depth"].dtype == np.int16
+    # Whole numbers are only stored as float32 if they are exact
+    assert result["Nodes"].dtype == np.float64
+    assert result["IntInf"].dtype == np.float32
+    assert result["Gap"].dtype == np.float32
+    assert result["Huge"].dtype == np.float64
+    assert isinstance(result["Type"].dtype, pd.CategoricalDtype)
+    assert result["Name"].dtype == object
+    np.testing.assert_allclose(result["Gap"], frame["Gap"], rtol=2.0**-24)
@@ -0,0 +1,82 @@
+import glob
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+import grblogtools as glt
+from grblogtools.api import ParseResult
+from grblogtools.segments import find_segments, parse_segment, stitch_segments
+
+
+@pytest.fixture
+def multirun_log(tmp_path, merged_text):
+    """A log file with the glass4 runs repeated several times."""
+    logfile = tmp_path / "multirun.log"
+    logfile.write_text(merged_text * 3)
+    return str(logfile)
+
+
+def test_find_segments(multirun_log):
+    segments = find_segments(multirun_log, min_size=10000)
+    assert len(segments) > 1
+    with open(multirun_log, "rb") as infile:
+        data = infile.read()
+    assert segments[0][0] == 0
+    assert segments[-1][1] == len(data)
+    for (_, end), (start, _) in zip(segments, segments[1:]):
+        assert end == start
+        assert data[start - 1 : start] == b"\n"
+        assert data[start:].startswith((b"Set parameter", b"Gurobi"))
+
+
+def test_find_segments_small(multirun_log):
+    assert find_segments(multirun_log) == [(0, None)]
+
+
+def test_stitch_segments(multirun_log):
+    """Stitched segments give the same run logs as a sequential parse."""
+    segments = find_segments(multirun_log, min_size=10000)
+    parsers = stitch_segments(
+        [parse_segment(multirun_log, start, end) for start, end in segments]
+    )
+    assert len(parsers) == 9
+
+
+def test_stitch_segments_split_run(multirun_log):
+    """A segment starting within a run log is detected."""
+    segments = find_segments(multirun_log, min_size=10000)
+    start, end = segments[1]
+    with open(multirun_log, "rb") as infile:
+        data = infile.read()
+    # Move the boundary past the first line of the run log
+    split = data.index(b"\n", start) + 1
+    parsed = [
+        parse_segment(multirun_log, *segments[0]),
+        parse_segment(multirun_log, segments[1][0], split),
+        parse_segment(multirun_log, split, end),
+    ]
+    assert stitch_segments(parsed) is None
+
+
+def test_parallel_segments(monkeypatch, multirun_log):
+    monkeypatch.setattr("grblogtools.segments.MIN_SEGMENT_SIZE", 10000)
+    expected = glt.parse(multirun_log)
+    result = glt.parse(multirun_log, jobs=2)
+    assert_frame_equal(result.summary(), expected.summary())
+    assert_frame_equal(result.progress("nodelog"), expected.progress("nodelog"))
+    assert result.summary()["LogNumber"].tolist() == list(range(1, 10))
+
+    single = ParseResult()
+    single.parse(multirun_log, jobs=2)
+    assert_frame_equal(single.summary(), expected.summary())
+
+
+def test_parallel_many_files(forbid):
+    """Files are not split when there are enough of them for the workers."""
+    forbid(glt.api, "find_segments")
+    logfiles = sorted(glob.glob("data/912-glass4-*.log"))
+    expected = glt.api.parse_logfiles(logfiles)
+    result = glt.api.parse_logfiles(logfiles, jobs=2)
+    assert [len(result[logfile]) for logfile in logfiles] == [
+        len(expected[logfile]) for logfile in logfiles
+    ]